@@ -134,8 +134,11 @@ async def lifespan(app: FastAPI):  # noqa: ARG001
             # Import and setup handlers from bot module
             try:
                 from bot.main import setup_handlers
+                from bot.utils.http import open_shared_client
 
                 setup_handlers(telegram_app_instance)
+                # Handlers reuse one keep-alive client for backend API calls
+                open_shared_client()
                 logger.info("✅ Bot handlers configured")
             except ImportError as e:
                 logger.error(f"❌ Failed to import bot handlers: {e}")
@@ -231,6 +234,11 @@ async def lifespan(app: FastAPI):  # noqa: ARG001
             logger.info("✅ Telegram bot shutdown completed")
         except Exception as e:
             logger.error(f"⚠️ Telegram bot shutdown warning: {e}")
+        finally:
+            # Close the handlers' shared client even if the bot failed to stop
+            from bot.utils.http import close_shared_client
+
+            await close_shared_client()
 
     close_database_connections()
     logger.info("✅ Application shutdown completed")
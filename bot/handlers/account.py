@@ -3,7 +3,6 @@
 
 import logging
 
-import httpx
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram.constants import ParseMode
 from telegram.ext import ContextTypes
@@ -12,6 +11,7 @@ from ..utils.formatting import (
     escape_html,
     format_error_message,
 )
+from ..utils.http import api_client
 from ..utils.timezones import TIMEZONE_DESCRIPTION_MAP
 
 logger = logging.getLogger(__name__)
@@ -31,7 +31,7 @@ async def confirm_delete_account(update: Update, context: ContextTypes.DEFAULT_T
         api_key = context.bot_data.get("api_key", "dev-bot-api-key-change-in-production")
 
         # Delete account via API
-        async with httpx.AsyncClient() as client:
+        async with api_client() as client:
             headers = {"X-API-Key": api_key}
             response = await client.delete(
                 f"{api_url}/api/v1/user/{user_id}",
@@ -270,7 +270,7 @@ async def profile_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         api_key = context.bot_data.get("api_key", "dev-bot-api-key-change-in-production")
 
         # Fetch user profile data
-        async with httpx.AsyncClient() as client:
+        async with api_client() as client:
             headers = {"X-API-Key": api_key}
 
             # Get user settings
@@ -541,7 +541,7 @@ async def sync_telegram_data_command(update: Update, context: ContextTypes.DEFAU
             "telegram_last_name": user.last_name,
         }
 
-        async with httpx.AsyncClient() as client:
+        async with api_client() as client:
             headers = {"X-API-Key": api_key}
             response = await client.put(
                 f"{api_url}/api/v1/user/profile/{user.id}",
@@ -612,7 +612,7 @@ async def handle_username_update(update: Update, context: ContextTypes.DEFAULT_T
         # Update username via API
         update_data = {"telegram_username": new_username}
 
-        async with httpx.AsyncClient() as client:
+        async with api_client() as client:
             headers = {"X-API-Key": api_key}
             response = await client.put(
                 f"{api_url}/api/v1/user/profile/{user.id}",
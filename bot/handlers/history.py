@@ -4,12 +4,12 @@
 import logging
 from typing import Any
 
-import httpx
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram.constants import ParseMode
 from telegram.ext import ContextTypes
 
 from ..utils.formatting import escape_html, format_error_message
+from ..utils.http import api_client
 from ..utils.timezones import (
     TIMEZONE_DESCRIPTION_MAP,
     format_datetime_for_user,
@@ -39,7 +39,7 @@ async def show_transaction_history(
         limit = 5  # Show 5 transactions per page
         offset = page * limit
 
-        async with httpx.AsyncClient() as client:
+        async with api_client() as client:
             headers = {"X-API-Key": api_key}
 
             timezone_code = "UTC"
@@ -336,7 +336,7 @@ async def transaction_details(update: Update, context: ContextTypes.DEFAULT_TYPE
         api_key = context.bot_data.get("api_key", "dev-bot-api-key-change-in-production")
 
         # Fetch transaction details
-        async with httpx.AsyncClient() as client:
+        async with api_client() as client:
             headers = {"X-API-Key": api_key}
             response = await client.get(
                 f"{api_url}/api/v1/transaction/{tx_hash}",
@@ -1,5 +1,7 @@
 # bot/handlers/price.py
+import asyncio
 import logging
+import time
 from typing import Any
 
 import httpx
@@ -12,6 +14,7 @@ from ..utils.formatting import (
     format_error_message,
     format_price_heatmap,
 )
+from ..utils.http import api_client
 
 HEATMAP_TIMEFRAMES = {"1D", "7D", "30D", "90D", "1Y"}
 TIMEFRAME_LABELS = {
@@ -23,6 +26,15 @@ TIMEFRAME_LABELS = {
 }
 DEFAULT_HEATMAP_TIMEFRAME = "30D"
 
+# Seconds a fetched price is reused across users and refresh taps
+PRICE_CACHE_TTL = 5.0
+
+# api_url -> (time.monotonic() of fetch, price data)
+_price_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+
+# api_url -> lock held while fetching, so concurrent misses share one request
+_price_fetch_locks: dict[str, asyncio.Lock] = {}
+
 logger = logging.getLogger(__name__)
 
 
@@ -55,7 +67,7 @@ async def price_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
         )
         currency = "USD"
         if user_id:
-            async with httpx.AsyncClient() as client:
+            async with api_client() as client:
                 headers = {"X-API-Key": api_key}
                 resp = await client.get(
                     f"{api_url}/api/v1/user/settings/{user_id}",
@@ -93,7 +105,9 @@ async def price_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
 
 
 async def fetch_price_data(api_url: str, api_key: str) -> dict[str, Any] | None:
-    """Fetch price data from the API.
+    """Fetch price data from the API, reusing a result younger than PRICE_CACHE_TTL.
+
+    Concurrent callers that miss the cache wait for a single request.
 
     Args:
     ----
@@ -105,8 +119,25 @@ async def fetch_price_data(api_url: str, api_key: str) -> dict[str, Any] | None:
         Price data dictionary or None if failed
 
     """
+    cached = _price_cache.get(api_url)
+    if cached and time.monotonic() - cached[0] < PRICE_CACHE_TTL:
+        return cached[1]
+
+    lock = _price_fetch_locks.get(api_url)
+    if lock is None:
+        lock = _price_fetch_locks[api_url] = asyncio.Lock()
+    async with lock:
+        # Another caller may have fetched the price while this one waited
+        cached = _price_cache.get(api_url)
+        if cached and time.monotonic() - cached[0] < PRICE_CACHE_TTL:
+            return cached[1]
+        return await _request_price_data(api_url, api_key)
+
+
+async def _request_price_data(api_url: str, api_key: str) -> dict[str, Any] | None:
+    """Request the current price from the API, caching it on success."""
     try:
-        async with httpx.AsyncClient() as client:
+        async with api_client() as client:
             headers = {"X-API-Key": api_key}
             response = await client.get(
                 f"{api_url}/api/v1/price/current",
@@ -116,7 +147,10 @@ async def fetch_price_data(api_url: str, api_key: str) -> dict[str, Any] | None:
 
             if response.status_code == 200:
                 result = response.json()
-                return result if isinstance(result, dict) else None
+                if not isinstance(result, dict):
+                    return None
+                _price_cache[api_url] = (time.monotonic(), result)
+                return result
             else:
                 logger.error(f"Price API returned status {response.status_code}")
                 return None
@@ -137,7 +171,7 @@ async def fetch_price_heatmap(
 ) -> dict[str, Any] | None:
     """Fetch price heatmap data from backend."""
     try:
-        async with httpx.AsyncClient() as client:
+        async with api_client() as client:
             headers = {"X-API-Key": api_key}
             response = await client.get(
                 f"{api_url}/api/v1/price/heatmap",
@@ -260,7 +294,7 @@ async def market_stats_callback(update: Update, context: ContextTypes.DEFAULT_TY
         currency = "USD"
         user_id = query.from_user.id if query.from_user else None
         if user_id:
-            async with httpx.AsyncClient() as client:
+            async with api_client() as client:
                 headers = {"X-API-Key": api_key}
                 resp = await client.get(
                     f"{api_url}/api/v1/user/settings/{user_id}",
@@ -321,7 +355,7 @@ async def price_refresh_callback(update: Update, context: ContextTypes.DEFAULT_T
         # Get user currency
         currency = "USD"
         user_id = query.from_user.id
-        async with httpx.AsyncClient() as client:
+        async with api_client() as client:
             headers = {"X-API-Key": api_key}
             resp = await client.get(
                 f"{api_url}/api/v1/user/settings/{user_id}",
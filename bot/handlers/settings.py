@@ -2,7 +2,6 @@
 import logging
 from typing import Any
 
-import httpx
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram.constants import ParseMode
 from telegram.ext import ContextTypes
@@ -11,6 +10,7 @@ from ..utils.formatting import (
     escape_html,
     format_error_message,
 )
+from ..utils.http import api_client
 from ..utils.timezones import (
     TIMEZONE_CHOICES,
     TIMEZONE_DESCRIPTION_MAP,
@@ -422,7 +422,7 @@ async def set_timezone(
 async def fetch_user_settings(api_url: str, api_key: str, user_id: int) -> dict[str, Any] | None:
     """Fetch user settings from API."""
     try:
-        async with httpx.AsyncClient() as client:
+        async with api_client() as client:
             headers = {"X-API-Key": api_key}
             response = await client.get(
                 f"{api_url}/api/v1/user/settings/{user_id}",
@@ -447,7 +447,7 @@ async def update_user_setting(
 ) -> bool:
     """Update a user setting via API."""
     try:
-        async with httpx.AsyncClient() as client:
+        async with api_client() as client:
             headers = {"X-API-Key": api_key}
 
             # For toggle settings, we send a toggle request
@@ -605,7 +605,7 @@ async def export_data(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
         api_key = context.bot_data.get("api_key", "dev-bot-api-key-change-in-production")
 
         # Request data export from API
-        async with httpx.AsyncClient() as client:
+        async with api_client() as client:
             headers = {"X-API-Key": api_key}
             response = await client.post(
                 f"{api_url}/api/v1/user/export/{user_id}",
@@ -17,6 +17,7 @@ from ..utils.formatting import (
     format_success_message,
     format_xrp_address,
 )
+from ..utils.http import api_client
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +32,7 @@ async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     # Check if user already exists
     user_exists = False
     try:
-        async with httpx.AsyncClient() as client:
+        async with api_client() as client:
             api_url = context.bot_data.get("api_url", "http://localhost:8000")
             api_key = context.bot_data.get("api_key", "dev-bot-api-key-change-in-production")
             headers = {"X-API-Key": api_key}
@@ -102,7 +103,7 @@ async def show_returning_user_welcome(update: Update, context: ContextTypes.DEFA
         return
 
     try:
-        async with httpx.AsyncClient() as client:
+        async with api_client() as client:
             api_url = context.bot_data.get("api_url", "http://localhost:8000")
             api_key = context.bot_data.get("api_key", "dev-bot-api-key-change-in-production")
             headers = {"X-API-Key": api_key}
@@ -230,7 +231,7 @@ async def handle_wallet_creation(
     }
 
     try:
-        async with httpx.AsyncClient() as client:
+        async with api_client() as client:
             api_url = context.bot_data.get("api_url", "http://localhost:8000")
             api_key = context.bot_data.get("api_key", "dev-bot-api-key-change-in-production")
 
@@ -506,11 +507,9 @@ async def handle_wallet_import_message(update: Update, context: ContextTypes.DEF
 
     try:
         # Import the wallet using backend API
-        import httpx
-
         backend_url = os.getenv("BACKEND_URL", "http://localhost:8000")
 
-        async with httpx.AsyncClient() as client:
+        async with api_client() as client:
             response = await client.post(
                 f"{backend_url}/api/users/import-wallet",
                 json={
@@ -26,6 +26,7 @@ from ..utils.formatting import (
     format_warning_message,
     format_xrp_address,
 )
+from ..utils.http import api_client
 
 logger = logging.getLogger(__name__)
 
@@ -184,7 +185,7 @@ async def _show_beneficiary_list(callback_query, context: ContextTypes.DEFAULT_T
 
     user_id = str(callback_query.from_user.id)
     try:
-        async with httpx.AsyncClient() as client:
+        async with api_client() as client:
             api_url = context.bot_data.get("api_url", "http://localhost:8000")
             api_key = context.bot_data.get("api_key", "dev-bot-api-key-change-in-production")
             headers = {"X-API-Key": api_key}
@@ -374,7 +375,7 @@ async def beneficiary_add_address_handler(
         return ConversationHandler.END
 
     try:
-        async with httpx.AsyncClient() as client:
+        async with api_client() as client:
             api_url = context.bot_data.get("api_url", "http://localhost:8000")
             api_key = context.bot_data.get("api_key", "dev-bot-api-key-change-in-production")
             headers = {"X-API-Key": api_key}
@@ -547,7 +548,7 @@ async def confirm_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     )
 
     try:
-        async with httpx.AsyncClient() as client:
+        async with api_client() as client:
             api_url = context.bot_data.get("api_url", "http://localhost:8000")
             api_key = context.bot_data.get("api_key", "dev-bot-api-key-change-in-production")
 
@@ -705,7 +706,7 @@ async def history_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user_id = update.effective_user.id
 
     try:
-        async with httpx.AsyncClient() as client:
+        async with api_client() as client:
             api_url = context.bot_data.get("api_url", "http://localhost:8000")
             api_key = context.bot_data.get("api_key", "dev-bot-api-key-change-in-production")
 
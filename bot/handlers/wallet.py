@@ -14,6 +14,7 @@ from ..utils.formatting import (
     format_username,
     format_xrp_address,
 )
+from ..utils.http import api_client
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +36,7 @@ async def balance_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         return
 
     try:
-        async with httpx.AsyncClient() as client:
+        async with api_client() as client:
             api_url = context.bot_data.get("api_url", "http://localhost:8000")
             api_key = context.bot_data.get("api_key", "dev-bot-api-key-change-in-production")
 
@@ -132,7 +133,7 @@ async def profile_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         return
 
     try:
-        async with httpx.AsyncClient() as client:
+        async with api_client() as client:
             api_url = context.bot_data.get("api_url", "http://localhost:8000")
             api_key = context.bot_data.get("api_key", "dev-bot-api-key-change-in-production")
 
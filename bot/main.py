@@ -1,18 +1,40 @@
+import asyncio
+import atexit
+import functools
 import logging
+import logging.handlers
 import os
+import queue
+import re
+import sys
+import time
+import weakref
+from collections import deque
+from collections.abc import Awaitable, Callable, Coroutine
+from dataclasses import dataclass
+from typing import Any, TypeVar, cast
 
+import httpx
+import orjson
 from dotenv import load_dotenv
-from telegram import Update
+from telegram import CallbackQuery, InlineKeyboardMarkup, Message, Update
 from telegram.constants import ParseMode
+from telegram.error import BadRequest, Forbidden, NetworkError, TimedOut
 from telegram.ext import (
+    AIORateLimiter,
     Application,
+    BaseUpdateProcessor,
     CallbackQueryHandler,
     CommandHandler,
     ContextTypes,
     ConversationHandler,
     MessageHandler,
+    PersistenceInput,
+    PicklePersistence,
+    TypeHandler,
     filters,
 )
+from telegram.request import HTTPXRequest
 
 # Load environment variables first
 load_dotenv()
@@ -25,9 +47,24 @@ from .handlers.account import (
     sync_telegram_data_command,
     update_username_command,
 )
-from .handlers.price import price_command
-from .handlers.settings import settings_command
+from .handlers.history import history_command as paginated_history_command
+from .handlers.history import history_page
+from .handlers.price import market_stats_callback, price_command, price_refresh_callback
+from .handlers.settings import (
+    currency_settings,
+    delete_account_warning,
+    export_data,
+    language_settings,
+    notification_settings,
+    security_settings,
+    set_currency,
+    set_timezone,
+    settings_command,
+    timezone_settings,
+    toggle_setting,
+)
 from .handlers.start import (
+    WAITING_FOR_PRIVATE_KEY,
     handle_back_to_start,
     handle_confirm_testnet_import,
     handle_create_new_wallet,
@@ -60,16 +97,75 @@ from .handlers.transaction import (
 )
 from .handlers.wallet import balance_command
 from .keyboards.menus import keyboards
+from .utils.formatting import format_error_message
+from .utils.http import close_shared_client, open_shared_client
+
+
+@dataclass(frozen=True, slots=True)
+class _Config:
+    """Environment-derived bot settings, read once at import time."""
+
+    bot_token: str | None
+    api_url: str
+    webhook_url: str | None
+    webhook_secret: str | None
+    render_url: str | None
+    port: int
+    environment: str
+    is_render: bool
+    debug: bool
+    telegram_pool_size: int
+    telegram_pool_timeout: float
+    poll_interval: float
+    state_file: str
+    log_level: str
+
+
+_NumberT = TypeVar("_NumberT", int, float)
+
 
-# Configure logging based on environment
-log_level = logging.DEBUG if os.getenv("DEBUG", "").lower() == "true" else logging.INFO
-logging.basicConfig(
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    level=log_level,
+def _env_number(name: str, default: _NumberT) -> _NumberT:
+    """Read a numeric setting, falling back to ``default`` if it is unset or malformed.
+
+    The backend imports this module too, and must not fail to start over a bad
+    value for a setting only the standalone bot uses.
+    """
+    raw = os.getenv(name)
+    if not raw:
+        return default
+    try:
+        return type(default)(raw)
+    except ValueError:
+        logging.getLogger(__name__).warning("⚠️ Invalid %s %r - using %s", name, raw, default)
+        return default
+
+
+CFG = _Config(
+    bot_token=os.getenv("TELEGRAM_BOT_TOKEN"),
+    api_url=os.getenv("API_URL", "http://localhost:8000"),
+    webhook_url=os.getenv("TELEGRAM_WEBHOOK_URL"),
+    webhook_secret=os.getenv("TELEGRAM_WEBHOOK_SECRET") or None,
+    render_url=os.getenv("RENDER_EXTERNAL_URL"),
+    port=_env_number("PORT", 8443),
+    environment=os.getenv("ENVIRONMENT", "development"),
+    # Render detection
+    is_render=os.getenv("RENDER") is not None,
+    debug=os.getenv("DEBUG", "").lower() == "true",
+    # Outbound Bot API connection pool (tunable per deployment)
+    telegram_pool_size=_env_number("TELEGRAM_POOL_SIZE", 32),
+    telegram_pool_timeout=_env_number("TELEGRAM_POOL_TIMEOUT", 20.0),
+    # Delay between getUpdates calls in polling mode
+    poll_interval=_env_number("POLL_INTERVAL", 0.0),
+    # Pickle file holding user data and conversation state across restarts
+    state_file=os.getenv("BOT_STATE_FILE", "bot_state.pkl"),
+    # Root level for the standalone bot; empty means DEBUG/INFO depending on debug
+    log_level=os.getenv("LOG_LEVEL", "").upper(),
 )
 
-# Reduce noisy library logging
-if os.getenv("ENVIRONMENT") == "production" or not os.getenv("DEBUG"):
+# Reduce noisy library logging. Done at import so it also applies when the
+# backend imports this module: at INFO, httpx logs request URLs, and Bot API
+# URLs contain the bot token.
+if CFG.environment == "production" or not CFG.debug:
     # Production: Minimal noise
     logging.getLogger("httpx").setLevel(logging.ERROR)
     logging.getLogger("httpcore").setLevel(logging.ERROR)
@@ -84,17 +180,190 @@ else:
 
 logger = logging.getLogger(__name__)
 
-# --- Configuration ---
-BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
 BOT_API_KEY = None  # Will be initialized later
-API_URL = os.getenv("API_URL", "http://localhost:8000")
-WEBHOOK_URL = os.getenv("TELEGRAM_WEBHOOK_URL")
-RENDER_URL = os.getenv("RENDER_EXTERNAL_URL")
-PORT = int(os.getenv("PORT", 8443))
-ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
 
-# Render detection
-IS_RENDER = os.getenv("RENDER") is not None
+# Seconds within which a repeated menu or refresh callback from the same user is dropped
+DUPLICATE_CALLBACK_WINDOW = 0.5
+
+# Upper bound in seconds on answering a callback query from the error handler
+CALLBACK_ANSWER_TIMEOUT = 2.0
+
+# Maximum number of menus remembered for the "back" button
+NAV_STACK_LIMIT = 16
+
+# Seconds after which an abandoned /send conversation is ended
+SEND_CONVERSATION_TIMEOUT = 10 * 60
+
+# Seconds between writes of the persisted bot state to disk
+STATE_FLUSH_INTERVAL = 60
+
+# user_data of users inactive for longer than this (seconds) is dropped by a
+# sweep that runs every USER_DATA_SWEEP_INTERVAL seconds
+USER_DATA_TTL = 24 * 60 * 60
+USER_DATA_SWEEP_INTERVAL = 60 * 60
+
+# Update types with registered handlers; Telegram doesn't send the rest
+ALLOWED_UPDATES = ["message", "callback_query"]
+
+# Upper bound on updates processed at once across all chats
+MAX_CONCURRENT_UPDATES = 256
+
+# Last (callback data, monotonic time) per user, for dropping double taps. Kept
+# out of user_data so it isn't persisted; cleared by the user data sweep.
+_last_callbacks: dict[int, tuple[str, float]] = {}
+
+# Per-chat locks serialising update processing; entries vanish once no update holds them
+_chat_locks: weakref.WeakValueDictionary[int, asyncio.Lock] = weakref.WeakValueDictionary()
+
+# asyncio.TaskGroup is only available on Python 3.11+
+_USE_TASKGROUP = sys.version_info >= (3, 11)
+
+# User-facing error messages, formatted once and selected by error category
+_ERROR_MESSAGES = {
+    "timeout": format_error_message(
+        "Request Timeout\n\nThe request took too long to complete. Please try again."
+    ),
+    "connection": format_error_message(
+        "Connection Error\n\nUnable to connect to backend services. Please try again in a moment."
+    ),
+    "auth": format_error_message(
+        "Access Error\n\nAuthentication failed. Please restart the bot with /start."
+    ),
+    "bad_request": format_error_message(
+        "Invalid Request\n\nThe request was invalid. Please check your input and try again."
+    ),
+    "network": format_error_message(
+        "Network Error\n\nNetwork connectivity issue. Please check your connection."
+    ),
+    "generic": format_error_message(
+        "Something Went Wrong\n\nAn unexpected error occurred. Please try again later."
+    ),
+}
+
+# Error categories by exception type, checked in order before the message is
+# inspected (TimedOut and BadRequest derive from NetworkError, so they come first)
+_ERROR_TYPE_CATEGORIES: tuple[tuple[tuple[type[BaseException], ...], str], ...] = (
+    ((TimedOut, httpx.TimeoutException, asyncio.TimeoutError), "timeout"),
+    ((httpx.ConnectError,), "connection"),
+    ((Forbidden,), "auth"),
+    ((BadRequest,), "bad_request"),
+)
+
+# Transport failures whose message didn't identify anything more specific
+_NETWORK_ERROR_TYPES = (NetworkError, httpx.TransportError)
+
+# Keywords identifying an error category from its lowercased message, checked
+# in priority order so e.g. "connection timeout" is reported as a timeout
+_ERROR_KEYWORD_CATEGORIES: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("timeout", ("timeout",)),
+    ("connection", ("connect",)),
+    ("auth", ("forbidden", "unauthorized")),
+    ("bad_request", ("badrequest", "bad request")),
+    ("network", ("network", "dns")),
+)
+
+# Send conversation callback patterns, compiled once per process
+_PAT_CANCEL_SEND = re.compile(r"^cancel_send$")
+_PAT_SEND = re.compile(r"^(send|send_xrp)$")
+_PAT_SEND_MODE = re.compile(r"^send_mode_(beneficiary|address)$")
+_PAT_BENEFICIARY = re.compile(r"^beneficiary_(select:.*|add)$")
+
+# Callbacks that update the current view in place rather than navigating forward
+_IN_PLACE_PREFIXES = ("refresh_", "history_page_", "market_stats:")
+
+# Display-only buttons (e.g. the history page counter); answered but never routed
+_NOOP_CALLBACKS = frozenset({"page_info"})
+
+# The main and error menus are static, so build their text and markup once
+_MAIN_MENU_TEXT = "🏠 <b>Main Menu</b>\n\nWhat would you like to do?"
+_MAIN_MENU_MARKUP = keyboards.main_menu()
+_ERROR_MENU_MARKUP = keyboards.error_menu()
+
+# Fixed replies for callbacks that just swap the message for a notice and the main menu
+_STATIC_RESPONSES: dict[str, tuple[str, InlineKeyboardMarkup]] = {
+    "retry": ("🔄 <b>Retry</b>\n\nPlease try your last action again.", _MAIN_MENU_MARKUP),
+    "cancel_send": (
+        "❌ <b>Transaction Cancelled</b>\n\nTransaction has been cancelled.",
+        _MAIN_MENU_MARKUP,
+    ),
+    "confirm_send": (
+        "✅ <b>Transaction Confirmed</b>\n\nProcessing your transaction...",
+        _MAIN_MENU_MARKUP,
+    ),
+}
+
+_RouteHandler = Callable[[Update, ContextTypes.DEFAULT_TYPE], Coroutine[Any, Any, Any]]
+
+# Slash commands outside the send conversation: (command, handler)
+_COMMANDS: tuple[tuple[str, _RouteHandler], ...] = (
+    ("start", start_command),
+    ("help", help_command),
+    ("balance", balance_command),
+    ("price", price_command),
+    ("profile", profile_command),
+    ("history", history_command),
+    ("settings", settings_command),
+)
+
+# Callbacks that act in place without touching navigation state
+_ACTION_ROUTES: dict[str, _RouteHandler] = {
+    "create_new_wallet": handle_create_new_wallet,
+    "import_wallet": handle_import_wallet,
+    "learn_more_wallets": handle_learn_more,
+    "create_wallet_auto": handle_create_wallet_auto,
+    "create_wallet_manual": handle_create_wallet_manual,
+    "back_to_start": handle_back_to_start,
+    "confirm_testnet_import": handle_confirm_testnet_import,
+    "update_username": update_username_command,
+    "sync_telegram_data": sync_telegram_data_command,
+    "refresh_balance": balance_command,
+    "refresh_price": price_refresh_callback,
+    "refresh_history": history_command,
+}
+
+# Navigable menus: callback data -> (menu id recorded in nav state, handler)
+_MENU_ROUTES: dict[str, tuple[str, _RouteHandler]] = {
+    "balance": ("balance", balance_command),
+    "send": ("send", send_command),
+    "send_xrp": ("send", send_command),
+    "price": ("price", price_command),
+    "history": ("history", paginated_history_command),
+    "profile": ("profile", profile_command),
+    "edit_profile": ("edit_profile", edit_profile_command),
+    "help": ("help", help_command),
+    "settings": ("settings", settings_command),
+    "market_stats": ("market_stats", market_stats_callback),
+    "notification_settings": ("notification_settings", notification_settings),
+    "currency_settings": ("currency_settings", currency_settings),
+    "timezone_settings": ("timezone_settings", timezone_settings),
+    "security_settings": ("security_settings", security_settings),
+    "language_settings": ("language_settings", language_settings),
+    "export_data": ("export_data", export_data),
+    "delete_account": ("delete_account", delete_account_warning),
+}
+
+# Callbacks whose quick repeat would only re-render the same view, so a double
+# tap can be dropped. "back" and toggles are excluded: each press must count.
+_DEBOUNCED_CALLBACKS = frozenset(
+    [*_MENU_ROUTES, "main_menu", "refresh_balance", "refresh_price", "refresh_history"]
+)
+
+# Prefixed callbacks that render a menu: (prefix, menu id, handler)
+_PREFIX_ROUTES: tuple[tuple[str, str, _RouteHandler], ...] = (
+    ("history_page_", "history", history_page),
+    ("market_stats:", "market_stats", market_stats_callback),
+)
+
+# Prefixed callbacks whose suffix is passed to the handler; one match yields both
+# the handler key (the named group) and its argument
+_PARAM_ROUTE_RE = re.compile(
+    r"^(?:toggle_(?P<toggle>.*)|set_currency_(?P<currency>.*)|set_timezone_(?P<timezone>.*))$"
+)
+_PARAM_HANDLERS: dict[str, Callable[..., Coroutine[Any, Any, Any]]] = {
+    "toggle": toggle_setting,
+    "currency": set_currency,
+    "timezone": set_timezone,
+}
 
 
 async def callback_query_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -103,393 +372,324 @@ async def callback_query_handler(update: Update, context: ContextTypes.DEFAULT_T
     if not query or not query.data:
         return
 
-    # Answer the callback to remove the "loading" state from the button
-    await query.answer()
+    if query.data in _NOOP_CALLBACKS:
+        # Nothing to route
+        await _answer_callback(query)
+        return
+
+    # Answer the callback (clearing the button's "loading" state) concurrently with
+    # routing, so the answer round-trip doesn't delay the handler's own API calls
+    await _run_concurrently(
+        _answer_callback(query),
+        _route_callback(update, context, query.data, query.message),
+    )
+
 
+async def _answer_callback(query: CallbackQuery) -> None:
+    """Answer a callback query, logging instead of raising if that fails.
+
+    The answer only clears the button's loading spinner. It can fail when the
+    query is too old or a handler has already answered it, and that must never
+    cancel the routing running alongside it.
+    """
+    try:
+        await query.answer(cache_time=1)
+    except Exception as e:
+        logger.warning("Failed to answer callback query: %s", e)
+
+
+async def _in_chat_order(chat_id: int | None, aw: Awaitable[Any]) -> Any:
+    """Await ``aw`` after any earlier work for the same chat has finished.
+
+    Different chats never wait on each other.
+    """
+    if chat_id is None:
+        return await aw
+    lock = _chat_locks.get(chat_id)
+    if lock is None:
+        lock = _chat_locks[chat_id] = asyncio.Lock()
+    async with lock:
+        return await aw
+
+
+async def _run_concurrently(*aws: Coroutine[Any, Any, Any]) -> None:
+    """Run coroutines concurrently as one unit of work.
+
+    On Python 3.11+ a TaskGroup cancels the remaining work as soon as one
+    coroutine fails; the first failure is re-raised unwrapped so the error
+    handler sees the original exception rather than an ExceptionGroup.
+    """
+    if _USE_TASKGROUP:
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for aw in aws:
+                    tg.create_task(aw)
+        except BaseExceptionGroup as group:  # noqa: F821 - 3.11+ builtin
+            raise group.exceptions[0] from None
+    else:
+        results = await asyncio.gather(*aws, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+
+async def _route_callback(
+    update: Update, context: ContextTypes.DEFAULT_TYPE, data: str, message: Message | None
+) -> None:
+    """Route an inline keyboard callback to its handler and track navigation."""
     # --- Navigation stack management ---
     user_data = context.user_data
     if user_data is None:
         return
-    nav_stack = user_data.setdefault("nav_stack", [])
-    current_menu = user_data.get("current_menu", "main_menu")
 
-    data = query.data
+    # Ignore rapid repeat taps on menu and refresh buttons; the message would not change
+    user = update.effective_user
+    if user is not None:
+        now = time.monotonic()
+        last_data, last_ts = _last_callbacks.get(user.id, ("", 0.0))
+        if (
+            data in _DEBOUNCED_CALLBACKS
+            and data == last_data
+            and now - last_ts < DUPLICATE_CALLBACK_WINDOW
+        ):
+            return
+        _last_callbacks[user.id] = (data, now)
 
-    # Handle wallet creation callbacks first
-    if data == "create_new_wallet":
-        await handle_create_new_wallet(update, context)
+    nav_stack = user_data.get("nav_stack")
+    if not isinstance(nav_stack, deque):
+        # Bounded so users who only ever navigate forward don't grow it forever
+        nav_stack = deque(nav_stack or (), maxlen=NAV_STACK_LIMIT)
+        user_data["nav_stack"] = nav_stack
+
+    # In-place actions don't touch navigation state
+    action = _ACTION_ROUTES.get(data)
+    if action is not None:
+        await action(update, context)
         return
-    elif data == "import_wallet":
-        await handle_import_wallet(update, context)
+
+    # Handle universal back
+    if data == "back":
+        target = nav_stack.pop() if nav_stack else "main_menu"
+        await _route_to(update, context, user_data, nav_stack, message, target)
         return
-    elif data == "learn_more_wallets":
-        await handle_learn_more(update, context)
+
+    # Route based on callback data
+    route = _MENU_ROUTES.get(data)
+    if route is None:
+        for prefix, menu_id, handler in _PREFIX_ROUTES:
+            if data.startswith(prefix):
+                route = (menu_id, handler)
+                break
+    if route is not None:
+        # Only menu routes care whether this is an in-place action
+        is_refresh = data.startswith(_IN_PLACE_PREFIXES)
+        await _navigate(update, context, user_data, nav_stack, *route, is_refresh)
         return
-    elif data == "create_wallet_auto":
-        await handle_create_wallet_auto(update, context)
+
+    param_match = _PARAM_ROUTE_RE.match(data)
+    if param_match and param_match.lastgroup:
+        key = param_match.lastgroup
+        await _PARAM_HANDLERS[key](update, context, param_match[key])
         return
-    elif data == "create_wallet_manual":
-        await handle_create_wallet_manual(update, context)
+
+    if data == "main_menu":
+        nav_stack.clear()
+        await _route_to(update, context, user_data, nav_stack, message, "main_menu")
         return
-    elif data == "back_to_start":
-        await handle_back_to_start(update, context)
+
+    response = _STATIC_RESPONSES.get(data)
+    if response is not None:
+        if data == "confirm_send":
+            logger.info("Transaction confirmation requested")
+        if message:
+            text, markup = response
+            await message.edit_text(text, parse_mode=ParseMode.HTML, reply_markup=markup)
+
+
+async def _route_to(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    user_data: dict[Any, Any],
+    nav_stack: deque[str],
+    message: Message | None,
+    menu_id: str,
+) -> None:
+    """Show a previously visited menu (or the main menu) without pushing it."""
+    route = _MENU_ROUTES.get(menu_id) if menu_id != "main_menu" else None
+    if route is not None:
+        await _navigate(update, context, user_data, nav_stack, *route, True)
         return
-    elif data == "confirm_testnet_import":
-        await handle_confirm_testnet_import(update, context)
+    await _show_main_menu(message)
+    user_data["current_menu"] = "main_menu"
+
+
+async def _show_main_menu(message: Message | None) -> None:
+    """Replace a callback's message with the main menu."""
+    if message:
+        await message.edit_text(
+            _MAIN_MENU_TEXT,
+            parse_mode=ParseMode.HTML,
+            reply_markup=_MAIN_MENU_MARKUP,
+        )
+
+
+async def text_message_router(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Route free-text messages to whichever flow is waiting for input."""
+    user_data = context.user_data
+    if not user_data:
         return
 
-    # Helper to route to a given menu id
-    async def route_to(menu_id: str):
-        user_data["current_menu"] = menu_id
-        if menu_id == "main_menu":
-            message = "🏠 <b>Main Menu</b>\n\nWhat would you like to do?"
-            if query.message:
-                await query.message.edit_text(
-                    message,
-                    parse_mode=ParseMode.HTML,
-                    reply_markup=keyboards.main_menu(),
-                )
-            return
-        # Map menu id to handler
-        if menu_id == "balance":
-            await balance_command(update, context)
-        elif menu_id == "send" or menu_id == "send_xrp":
-            await send_command(update, context)
-        elif menu_id == "price":
-            await price_command(update, context)
-        elif menu_id == "history":
-            try:
-                from .handlers.history import history_command as hist_cmd
-
-                await hist_cmd(update, context)
-            except Exception:
-                await history_command(update, context)
-        elif menu_id == "profile":
-            await profile_command(update, context)
-        elif menu_id == "help":
-            await help_command(update, context)
-        elif menu_id == "settings":
-            await settings_command(update, context)
-        elif menu_id == "market_stats":
-            from .handlers.price import market_stats_callback
-
-            await market_stats_callback(update, context)
-        elif menu_id in (
-            "notification_settings",
-            "currency_settings",
-            "timezone_settings",
-            "security_settings",
-            "language_settings",
-            "export_data",
-            "delete_account",
-        ):
-            from .handlers.settings import (
-                currency_settings,
-                delete_account_warning,
-                export_data,
-                language_settings,
-                notification_settings,
-                security_settings,
-                timezone_settings,
-            )
+    if user_data.get("awaiting_username_update"):
+        await handle_username_update(update, context)
+    elif user_data.get("import_state") == WAITING_FOR_PRIVATE_KEY:
+        await handle_wallet_import_message(update, context)
 
-            if menu_id == "notification_settings":
-                await notification_settings(update, context)
-            elif menu_id == "currency_settings":
-                await currency_settings(update, context)
-            elif menu_id == "timezone_settings":
-                await timezone_settings(update, context)
-            elif menu_id == "security_settings":
-                await security_settings(update, context)
-            elif menu_id == "language_settings":
-                await language_settings(update, context)
-            elif menu_id == "export_data":
-                await export_data(update, context)
-            elif menu_id == "delete_account":
-                await delete_account_warning(update, context)
-        else:
-            await route_to("main_menu")
-            return
 
-    # Handle universal back
-    if data == "back":
-        target = nav_stack.pop() if nav_stack else "main_menu"
-        await route_to(target)
+async def _mark_user_seen(
+    update: Update,  # noqa: ARG001
+    context: ContextTypes.DEFAULT_TYPE,
+) -> None:
+    """Record when the user last interacted, for _sweep_stale_user_data."""
+    user_data = context.user_data
+    if user_data is None:
         return
+    # Wall-clock time, so users never timestamped sort before the cutoff. Only
+    # refreshed once per sweep interval (more precision is lost on an hourly
+    # sweep anyway), so most updates leave user_data unchanged for persistence.
+    now = time.time()
+    if now - user_data.get("_last_seen", 0) >= USER_DATA_SWEEP_INTERVAL:
+        user_data["_last_seen"] = now
 
-    # Determine if this is an in-place action
-    is_refresh = (
-        data.startswith("refresh_")
-        or data.startswith("history_page_")
-        or data.startswith("market_stats:")
-        or data in ("page_info",)
-    )
 
-    # Before navigating forward, push current menu onto stack
-    def push_if_forward(target_id: str):
-        if not is_refresh and target_id and target_id != current_menu:
-            if current_menu and current_menu != "main_menu":
-                nav_stack.append(current_menu)
+async def _sweep_stale_user_data(context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Drop user_data (navigation state, pending flows) of long-inactive users."""
+    application = context.application
+    cutoff = time.time() - USER_DATA_TTL
+    stale = [
+        user_id
+        for user_id, data in application.user_data.items()
+        if data.get("_last_seen", 0) < cutoff
+    ]
+    for user_id in stale:
+        application.drop_user_data(user_id)
+    if stale:
+        logger.info("🧹 Dropped user data for %d inactive users", len(stale))
+    # Double-tap entries only matter for DUPLICATE_CALLBACK_WINDOW seconds
+    _last_callbacks.clear()
 
-    # Route based on callback data
-    if data == "balance":
-        push_if_forward("balance")
-        await balance_command(update, context)
-        user_data["current_menu"] = "balance"
-    elif data in ("send", "send_xrp"):
-        push_if_forward("send")
-        await send_command(update, context)
-        user_data["current_menu"] = "send"
-    elif data == "price":
-        push_if_forward("price")
-        await price_command(update, context)
-        user_data["current_menu"] = "price"
-    elif data == "history":
-        push_if_forward("history")
-        try:
-            from .handlers.history import history_command as hist_cmd
-
-            await hist_cmd(update, context)
-        except Exception:
-            await history_command(update, context)
-        user_data["current_menu"] = "history"
-    elif data == "profile":
-        push_if_forward("profile")
-        await profile_command(update, context)
-        user_data["current_menu"] = "profile"
-    elif data == "edit_profile":
-        push_if_forward("edit_profile")
-        await edit_profile_command(update, context)
-        user_data["current_menu"] = "edit_profile"
-    elif data == "update_username":
-        await update_username_command(update, context)
-    elif data == "sync_telegram_data":
-        await sync_telegram_data_command(update, context)
-    elif data == "help":
-        push_if_forward("help")
-        await help_command(update, context)
-        user_data["current_menu"] = "help"
-    elif data == "main_menu":
-        nav_stack.clear()
-        message = "🏠 <b>Main Menu</b>\n\nWhat would you like to do?"
-        if query.message:
-            await query.message.edit_text(
-                message,
-                parse_mode=ParseMode.HTML,
-                reply_markup=keyboards.main_menu(),
-            )
-        user_data["current_menu"] = "main_menu"
-    elif query.data.startswith("refresh_"):
-        if data == "refresh_balance":
-            await balance_command(update, context)
-        elif data == "refresh_price":
-            from .handlers.price import price_refresh_callback
-
-            await price_refresh_callback(update, context)
-        elif data == "refresh_history":
-            await history_command(update, context)
-    elif data.startswith("history_page_"):
-        try:
-            from .handlers.history import history_page
-
-            await history_page(update, context)
-        except Exception:
-            await history_command(update, context)
-        user_data["current_menu"] = "history"
-    elif data.startswith("market_stats"):
-        push_if_forward("market_stats")
-        from .handlers.price import market_stats_callback
-
-        await market_stats_callback(update, context)
-        user_data["current_menu"] = "market_stats"
-    elif data.startswith(
-        (
-            "notification_",
-            "currency_",
-            "timezone_",
-            "security_",
-            "language_",
-            "export_",
-            "delete_",
-            "toggle_",
-            "set_",
-            "setup_",
-        )
-    ):
-        from .handlers.settings import (
-            currency_settings,
-            delete_account_warning,
-            export_data,
-            language_settings,
-            notification_settings,
-            security_settings,
-            set_currency,
-            set_timezone,
-            timezone_settings,
-            toggle_setting,
-        )
 
-        if data == "notification_settings":
-            push_if_forward("notification_settings")
-            await notification_settings(update, context)
-            user_data["current_menu"] = "notification_settings"
-        elif data == "currency_settings":
-            push_if_forward("currency_settings")
-            await currency_settings(update, context)
-            user_data["current_menu"] = "currency_settings"
-        elif data == "timezone_settings":
-            push_if_forward("timezone_settings")
-            await timezone_settings(update, context)
-            user_data["current_menu"] = "timezone_settings"
-        elif data == "security_settings":
-            push_if_forward("security_settings")
-            await security_settings(update, context)
-            user_data["current_menu"] = "security_settings"
-        elif data == "language_settings":
-            push_if_forward("language_settings")
-            await language_settings(update, context)
-            user_data["current_menu"] = "language_settings"
-        elif data == "export_data":
-            push_if_forward("export_data")
-            await export_data(update, context)
-            user_data["current_menu"] = "export_data"
-        elif data == "delete_account":
-            push_if_forward("delete_account")
-            await delete_account_warning(update, context)
-            user_data["current_menu"] = "delete_account"
-        elif data.startswith("toggle_"):
-            setting_name = data[7:]
-            await toggle_setting(update, context, setting_name)
-        elif data.startswith("set_currency_"):
-            currency = data[13:]
-            await set_currency(update, context, currency)
-        elif data.startswith("set_timezone_"):
-            timezone_value = data[len("set_timezone_") :]
-            await set_timezone(update, context, timezone_value)
-    elif data == "settings":
-        push_if_forward("settings")
-        await settings_command(update, context)
-        user_data["current_menu"] = "settings"
-    elif data in ["retry", "cancel_send", "confirm_send"]:
-        if data == "retry":
-            if query.message:
-                await query.message.edit_text(
-                    ("🔄 <b>Retry</b>\n\nPlease try your last action again."),
-                    parse_mode=ParseMode.HTML,
-                    reply_markup=keyboards.main_menu(),
-                )
-        elif data == "cancel_send":
-            if query.message:
-                await query.message.edit_text(
-                    ("❌ <b>Transaction Cancelled</b>\n\nTransaction has been cancelled."),
-                    parse_mode=ParseMode.HTML,
-                    reply_markup=keyboards.main_menu(),
-                )
-        elif data == "confirm_send":
-            logger.info("Transaction confirmation requested")
-            if query.message:
-                await query.message.edit_text(
-                    ("✅ <b>Transaction Confirmed</b>\n\nProcessing your transaction..."),
-                    parse_mode=ParseMode.HTML,
-                    reply_markup=keyboards.main_menu(),
-                )
+async def _flush_persistence(context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Write persisted user data and conversations to disk in a single dump."""
+    persistence = context.application.persistence
+    if persistence is not None:
+        await persistence.flush()
+
+
+async def _navigate(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    user_data: dict[Any, Any],
+    nav_stack: deque[str],
+    menu_id: str,
+    handler: _RouteHandler,
+    is_refresh: bool,
+) -> None:
+    """Render a menu, remembering the current one for "back" on forward navigation."""
+    current_menu = user_data.get("current_menu", "main_menu")
+    if not is_refresh and menu_id != current_menu:
+        if current_menu and current_menu != "main_menu":
+            nav_stack.append(current_menu)
+    await handler(update, context)
+    user_data["current_menu"] = menu_id
+
+
+def _classify_error(error: BaseException | None) -> str:
+    """Return the _ERROR_MESSAGES key describing ``error``."""
+    for error_types, category in _ERROR_TYPE_CATEGORIES:
+        if isinstance(error, error_types):
+            return category
+    # PTB reports other transport failures as a plain NetworkError whose message
+    # names the underlying httpx error, e.g. "httpx.ConnectError: ..."
+    error_str = str(error).lower()
+    for category, keywords in _ERROR_KEYWORD_CATEGORIES:
+        for keyword in keywords:
+            if keyword in error_str:
+                return category
+    return "network" if isinstance(error, _NETWORK_ERROR_TYPES) else "generic"
 
 
 async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE):
     """Enhanced error handler with detailed logging and user-friendly messages."""
     error = context.error
-    logger.error(f'Update "{update}" caused error "{error}"', exc_info=error)
+    # Only the id at ERROR: stringifying a whole Update can be very large
+    logger.error(
+        "Update %s caused error %r", getattr(update, "update_id", None), error, exc_info=error
+    )
+    logger.debug("Failing update: %s", update)
 
     if isinstance(update, Update):
         if update.callback_query:
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    await update.callback_query.answer(
+            # Best effort: the answer is advisory, so one bounded attempt is enough
+            # and the error handler can never hang on it
+            try:
+                await asyncio.wait_for(
+                    update.callback_query.answer(
                         "⚠️ An error occurred. Please try again.",
                         show_alert=True,
-                    )
-                    break
-                except Exception as e:
-                    logger.error(f"Failed to answer callback query (attempt {attempt + 1}): {e}")
-                    if attempt == max_retries - 1:
-                        logger.error("All callback query answer attempts failed")
+                    ),
+                    timeout=CALLBACK_ANSWER_TIMEOUT,
+                )
+            except Exception as e:
+                logger.warning("Failed to answer callback query: %s", e)
 
         if update.effective_message:
+            # Plain sends to the chat: no reply lookup, and no push notification
+            chat_id = update.effective_message.chat_id
             try:
-                from .keyboards.menus import keyboards
-                from .utils.formatting import format_error_message
-
-                error_str = str(error).lower()
-
-                if "timeout" in error_str or "asyncio.timeouterror" in error_str:
-                    error_msg = format_error_message(
-                        "Request Timeout\n\n"
-                        "The request took too long to complete. Please try again."
-                    )
-                elif "connection" in error_str or "connect" in error_str:
-                    error_msg = format_error_message(
-                        "Connection Error\n\n"
-                        "Unable to connect to backend services. "
-                        "Please try again in a moment."
-                    )
-                elif "forbidden" in error_str or "unauthorized" in error_str:
-                    error_msg = format_error_message(
-                        "Access Error\n\nAuthentication failed. Please restart the bot with /start."
-                    )
-                elif "badrequest" in error_str or "bad request" in error_str:
-                    error_msg = format_error_message(
-                        "Invalid Request\n\n"
-                        "The request was invalid. Please check your input and try again."
-                    )
-                elif "network" in error_str or "dns" in error_str:
-                    error_msg = format_error_message(
-                        "Network Error\n\nNetwork connectivity issue. Please check your connection."
-                    )
-                else:
-                    error_msg = format_error_message(
-                        "Something Went Wrong\n\n"
-                        "An unexpected error occurred. Please try again later."
-                    )
+                error_msg = _ERROR_MESSAGES[_classify_error(error)]
 
                 try:
-                    if "keyboards" in locals() and keyboards is not None:
-                        await update.effective_message.reply_text(
-                            error_msg,
-                            parse_mode=ParseMode.HTML,
-                            reply_markup=keyboards.error_menu(),
-                        )
-                    else:
-                        await update.effective_message.reply_text(
-                            error_msg,
-                            parse_mode=ParseMode.HTML,
-                        )
+                    await context.bot.send_message(
+                        chat_id,
+                        error_msg,
+                        parse_mode=ParseMode.HTML,
+                        reply_markup=_ERROR_MENU_MARKUP,
+                        disable_notification=True,
+                    )
                 except Exception as send_error:
-                    logger.error(f"Failed to send formatted error message: {send_error}")
+                    logger.error("Failed to send formatted error message: %s", send_error)
                     try:
-                        await update.effective_message.reply_text(
-                            "⚠️ An error occurred. Please try again later."
+                        await context.bot.send_message(
+                            chat_id,
+                            "⚠️ An error occurred. Please try again later.",
+                            disable_notification=True,
                         )
                     except Exception as final_error:
-                        logger.error(f"Failed to send fallback error message: {final_error}")
+                        logger.error("Failed to send fallback error message: %s", final_error)
 
-            except ImportError as import_error:
-                logger.error(f"Import error in error handler: {import_error}")
-                try:
-                    await update.effective_message.reply_text(
-                        "⚠️ Service temporarily unavailable. Please try again."
-                    )
-                except Exception as e:
-                    logger.error(f"Final fallback error message failed: {e}")
             except Exception as e:
-                logger.error(f"Error in error message handling: {e}")
+                logger.error("Error in error message handling: %s", e)
                 try:
-                    await update.effective_message.reply_text(
-                        "⚠️ Error occurred. Please restart with /start."
+                    await context.bot.send_message(
+                        chat_id,
+                        "⚠️ Error occurred. Please restart with /start.",
+                        disable_notification=True,
                     )
                 except Exception as e:
                     # Final fallback failed - log but don't raise to prevent error loops
-                    logger.error(f"Absolute final fallback error message failed: {e}")
+                    logger.error("Absolute final fallback error message failed: %s", e)
+
+
+@functools.cache
+def _backend_settings() -> Any:
+    """Import and configure the backend settings once, on first use.
+
+    Kept out of module import so a standalone bot doesn't load the backend
+    config chain until post_init needs it; a failed attempt is not cached.
+    """
+    from backend.config import initialize_settings
+
+    return initialize_settings()
 
 
 async def post_init(application: Application):
@@ -497,24 +697,28 @@ async def post_init(application: Application):
     global BOT_API_KEY
 
     if not BOT_API_KEY:
-        try:
-            from backend.config import initialize_settings
-
-            settings = initialize_settings()
-            BOT_API_KEY = settings.BOT_API_KEY
-            logger.info("✅ API key synchronized with backend settings")
-        except Exception as e:
-            logger.warning(f"⚠️ Could not get API key from backend settings: {e}")
-            BOT_API_KEY = os.getenv("BOT_API_KEY", "dev-bot-fallback-key")
+        if application.bot_data.get("api_key"):
+            # Already provided by whoever built the application (e.g. the backend)
+            BOT_API_KEY = application.bot_data["api_key"]
+        else:
+            try:
+                BOT_API_KEY = _backend_settings().BOT_API_KEY
+                logger.info("✅ API key synchronized with backend settings")
+            except Exception as e:
+                logger.warning("⚠️ Could not get API key from backend settings: %s", e)
+                BOT_API_KEY = os.getenv("BOT_API_KEY", "dev-bot-fallback-key")
 
-    application.bot_data["api_url"] = API_URL
+    application.bot_data["api_url"] = CFG.api_url
     application.bot_data["api_key"] = BOT_API_KEY
 
-    logger.info(f"🤖 Bot initialized with API URL: {API_URL}")
-    logger.info(f"🌐 Environment: {ENVIRONMENT}")
-    logger.info(f"🔧 Render deployment: {IS_RENDER}")
+    # Handlers reuse one keep-alive client for backend API calls
+    open_shared_client()
+
+    logger.info("🤖 Bot initialized with API URL: %s", CFG.api_url)
+    logger.info("🌐 Environment: %s", CFG.environment)
+    logger.info("🔧 Render deployment: %s", CFG.is_render)
 
-    if IS_RENDER or ENVIRONMENT == "production":
+    if CFG.is_render or CFG.environment == "production":
         logger.info("Production mode detected - bot should only run via webhook")
         if __name__ == "__main__":
             logger.warning("⚠️ Bot main.py should not be run directly in production!")
@@ -524,130 +728,314 @@ async def post_init(application: Application):
 
         # Initialize database for development mode
         try:
-            from backend.config import initialize_settings
             from backend.database.connection import init_database, initialize_database_engine
 
-            settings = initialize_settings()
+            settings = _backend_settings()
             initialize_database_engine(settings.DATABASE_URL, settings.DEBUG)
             init_database()
             logger.info("✅ Database initialized for development mode")
         except Exception as e:
-            logger.error(f"❌ Failed to initialize database in development mode: {e}")
+            logger.error("❌ Failed to initialize database in development mode: %s", e)
 
-        # Development mode - start XRP monitoring
-        try:
-            from backend.services.xrp_monitor import start_xrp_monitoring
+        # Development mode - start XRP monitoring (once, even if post_init re-runs)
+        if not application.bot_data.get("monitor_started"):
+            try:
+                from backend.services.xrp_monitor import start_xrp_monitoring
 
-            await start_xrp_monitoring()
-            logger.info("✅ XRP transaction monitoring started (development mode)")
-        except Exception as e:
-            logger.error(f"❌ Failed to start XRP monitoring in development mode: {e}")
+                await start_xrp_monitoring()
+                application.bot_data["monitor_started"] = True
+                logger.info("✅ XRP transaction monitoring started (development mode)")
+            except Exception as e:
+                logger.error("❌ Failed to start XRP monitoring in development mode: %s", e)
+
+
+async def post_shutdown(application: Application):  # noqa: ARG001
+    """Release resources opened in post_init."""
+    await close_shared_client()
 
 
 def setup_handlers(application: Application):
     """Set up all bot handlers - can be called from backend for webhook mode."""
+    # Runs before every other handler (group -1) to timestamp user activity
+    application.add_handler(TypeHandler(Update, _mark_user_seen), group=-1)
+
+    # Shared across conversation states so the pattern is compiled and matched by one object
+    cancel_send_handler = CallbackQueryHandler(cancel_handler, pattern=_PAT_CANCEL_SEND)
+    text_filter = filters.TEXT & ~filters.COMMAND
+
     # Create conversation handler for send command
     send_conversation_handler = ConversationHandler(
         entry_points=[
             CommandHandler("send", send_command),
-            CallbackQueryHandler(send_command, pattern=r"^(send|send_xrp)$"),
+            CallbackQueryHandler(send_command, pattern=_PAT_SEND),
         ],
         states={
             MODE: [
-                CallbackQueryHandler(
-                    send_mode_handler,
-                    pattern=r"^send_mode_(beneficiary|address)$",
-                ),
-                CallbackQueryHandler(cancel_handler, pattern=r"^cancel_send$"),
+                CallbackQueryHandler(send_mode_handler, pattern=_PAT_SEND_MODE),
+                cancel_send_handler,
             ],
             BENEFICIARY_SELECT: [
-                CallbackQueryHandler(
-                    beneficiary_selection_handler,
-                    pattern=r"^beneficiary_(select:.*|add)$",
-                ),
-                CallbackQueryHandler(cancel_handler, pattern=r"^cancel_send$"),
+                CallbackQueryHandler(beneficiary_selection_handler, pattern=_PAT_BENEFICIARY),
+                cancel_send_handler,
             ],
             BENEFICIARY_ADD_ALIAS: [
-                MessageHandler(
-                    filters.TEXT & ~filters.COMMAND,
-                    beneficiary_add_alias_handler,
-                ),
-                CallbackQueryHandler(cancel_handler, pattern=r"^cancel_send$"),
+                MessageHandler(text_filter, beneficiary_add_alias_handler),
+                cancel_send_handler,
             ],
             BENEFICIARY_ADD_ADDRESS: [
-                MessageHandler(
-                    filters.TEXT & ~filters.COMMAND,
-                    beneficiary_add_address_handler,
-                ),
-                CallbackQueryHandler(cancel_handler, pattern=r"^cancel_send$"),
+                MessageHandler(text_filter, beneficiary_add_address_handler),
+                cancel_send_handler,
             ],
             AMOUNT: [
-                MessageHandler(filters.TEXT & ~filters.COMMAND, amount_handler),
-                CallbackQueryHandler(cancel_handler, pattern=r"^cancel_send$"),
+                MessageHandler(text_filter, amount_handler),
+                cancel_send_handler,
             ],
             ADDRESS: [
-                MessageHandler(filters.TEXT & ~filters.COMMAND, address_handler),
-                CallbackQueryHandler(cancel_handler, pattern=r"^cancel_send$"),
+                MessageHandler(text_filter, address_handler),
+                cancel_send_handler,
             ],
-            CONFIRM: [MessageHandler(filters.TEXT & ~filters.COMMAND, confirm_handler)],
+            CONFIRM: [MessageHandler(text_filter, confirm_handler)],
         },
         fallbacks=[
             CommandHandler("cancel", cancel_handler),
-            CallbackQueryHandler(cancel_handler, pattern=r"^cancel_send$"),
+            cancel_send_handler,
         ],
+        # Abandoned flows are dropped instead of being kept forever
+        conversation_timeout=SEND_CONVERSATION_TIMEOUT,
+        name="send_flow",
+        persistent=application.persistence is not None,
     )
 
-    # Add all handlers to the application
-    application.add_handler(CommandHandler("start", start_command))
-    application.add_handler(CommandHandler("help", help_command))
-    application.add_handler(CommandHandler("balance", balance_command))
-    application.add_handler(CommandHandler("price", price_command))
-    application.add_handler(CommandHandler("profile", profile_command))
-    application.add_handler(CommandHandler("history", history_command))
-    application.add_handler(CommandHandler("settings", settings_command))
-    application.add_handler(send_conversation_handler)
-
-    # Add message handler for username updates (highest priority for text messages)
-    application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_username_update))
-
-    # Add message handler for wallet imports (lower priority)
-    application.add_handler(
-        MessageHandler(filters.TEXT & ~filters.COMMAND, handle_wallet_import_message)
+    # Registered in one batch; order matters, as PTB runs only the first
+    # matching handler per group
+    application.add_handlers(
+        [
+            *(CommandHandler(command, callback) for command, callback in _COMMANDS),
+            send_conversation_handler,
+            # Free-text input outside the send conversation (username updates,
+            # wallet imports)
+            MessageHandler(text_filter, text_message_router),
+            # Catch-all for inline buttons. It stays in the default group, after
+            # the send conversation, so callbacks the conversation claims never
+            # reach this dispatcher. A later group would receive those updates
+            # as well.
+            CallbackQueryHandler(callback_query_handler),
+        ]
     )
-
-    application.add_handler(CallbackQueryHandler(callback_query_handler))
     application.add_error_handler(error_handler)
 
+    if application.job_queue is not None:
+        application.job_queue.run_repeating(
+            _sweep_stale_user_data,
+            interval=USER_DATA_SWEEP_INTERVAL,
+            first=USER_DATA_SWEEP_INTERVAL,
+        )
+        if application.persistence is not None:
+            application.job_queue.run_repeating(
+                _flush_persistence,
+                interval=STATE_FLUSH_INTERVAL,
+                first=STATE_FLUSH_INTERVAL,
+            )
+    else:
+        logger.warning("⚠️ JobQueue unavailable - inactive user data will not be swept")
+
     logger.info("✅ Bot handlers configured successfully")
 
 
+class _OrjsonHTTPXRequest(HTTPXRequest):
+    """HTTPXRequest that decodes Bot API responses with orjson instead of json.
+
+    orjson turns integers beyond 64 bits into floats, but Bot API identifiers
+    fit in 52 bits, so responses decode exactly as with the stock parser.
+    """
+
+    @staticmethod
+    def parse_json_payload(payload: bytes) -> dict[str, Any]:
+        try:
+            return cast(dict[str, Any], orjson.loads(payload))
+        except orjson.JSONDecodeError:
+            # Invalid UTF-8 or JSON: the stock parser replaces undecodable bytes
+            # and raises TelegramError for anything it still can't load
+            return HTTPXRequest.parse_json_payload(payload)
+
+
+class _ChatOrderedUpdateProcessor(BaseUpdateProcessor):
+    """Process updates concurrently across chats but one at a time within a chat.
+
+    ConversationHandler assumes a chat's updates are handled sequentially; with
+    plain concurrent updates two quick messages in the /send flow could both be
+    checked against the old state. Ordering per chat also keeps two quick
+    button presses from editing the same message out of order.
+    """
+
+    def __init__(self, max_concurrent_updates: int):
+        # The base class takes a slot before calling do_process_update, i.e.
+        # before the chat lock, so a backlog in one chat would hold slots other
+        # chats need. Its own limit is left unbounded; ours is taken once it is
+        # the chat's turn.
+        super().__init__(sys.maxsize)
+        self._slots = asyncio.BoundedSemaphore(max_concurrent_updates)
+
+    async def do_process_update(self, update: object, coroutine: Awaitable[Any]) -> None:
+        chat = update.effective_chat if isinstance(update, Update) else None
+        await _in_chat_order(chat.id if chat else None, self._run_in_slot(coroutine))
+
+    async def _run_in_slot(self, coroutine: Awaitable[Any]) -> None:
+        async with self._slots:
+            await coroutine
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+
+def _build_persistence(filepath: str) -> PicklePersistence:
+    """Build the persistence that keeps user data and send conversations across restarts.
+
+    bot_data is rebuilt by post_init (and holds the API key, which shouldn't be
+    written to disk). With on_flush, persistence cycles only update the
+    in-memory copy; the file is written once per STATE_FLUSH_INTERVAL by
+    _flush_persistence and at shutdown, instead of once per changed user.
+    """
+    return PicklePersistence(
+        filepath=filepath,
+        store_data=PersistenceInput(bot_data=False, callback_data=False),
+        update_interval=30,
+        on_flush=True,
+    )
+
+
+def _install_uvloop() -> None:
+    """Use uvloop as the asyncio event loop where it is available."""
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not installed - using the default asyncio event loop")
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+def setup_logging() -> None:
+    """Configure logging for the standalone bot process.
+
+    Records are passed through a queue to a background thread that writes them
+    to stderr, so the event loop never blocks on the write. Called from main()
+    rather than at import, so importing this module (e.g. from the backend)
+    leaves the host's handlers and root level alone.
+    """
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
+    listener = logging.handlers.QueueListener(queue.SimpleQueue(), stream_handler)
+    root = logging.getLogger()
+    root.handlers[:] = [logging.handlers.QueueHandler(listener.queue)]
+    listener.start()
+    # Flush queued records on exit
+    atexit.register(listener.stop)
+
+    default_level = logging.DEBUG if CFG.debug else logging.INFO
+    try:
+        root.setLevel(CFG.log_level or default_level)
+    except ValueError:
+        root.setLevel(default_level)
+        logger.warning(
+            "⚠️ Unknown LOG_LEVEL %r - using %s",
+            CFG.log_level,
+            logging.getLevelName(default_level),
+        )
+
+
 def main():
     """Start the bot."""
-    if not BOT_TOKEN:
+    setup_logging()
+
+    if not CFG.bot_token:
         logger.error("TELEGRAM_BOT_TOKEN not found in environment variables!")
         return
 
-    if IS_RENDER or ENVIRONMENT == "production":
+    if CFG.is_render or CFG.environment == "production":
         logger.error("❌ This script should not be run directly in production!")
         logger.error("❌ In production, the bot runs via webhooks through the backend service")
         logger.info("💡 Use the backend service instead: python -m backend.main")
         return
 
-    application = Application.builder().token(BOT_TOKEN).post_init(post_init).build()
+    _install_uvloop()
+
+    # Separate pools for outbound Bot API calls and the long-poll connection so
+    # bursts of button presses don't starve getUpdates (or vice versa). HTTP/2 lets
+    # concurrent calls share a connection to api.telegram.org.
+    request = _OrjsonHTTPXRequest(
+        connection_pool_size=CFG.telegram_pool_size,
+        pool_timeout=CFG.telegram_pool_timeout,
+        connect_timeout=10.0,
+        read_timeout=30.0,
+        http_version="2",
+    )
+    # read_timeout must exceed the 50s long-poll timeout passed to run_polling
+    get_updates_request = _OrjsonHTTPXRequest(
+        connection_pool_size=4,
+        pool_timeout=60.0,
+        read_timeout=55.0,
+        http_version="2",
+    )
+    persistence = _build_persistence(CFG.state_file)
+    application = (
+        Application.builder()
+        .token(CFG.bot_token)
+        .request(request)
+        .get_updates_request(get_updates_request)
+        .rate_limiter(
+            AIORateLimiter(
+                overall_max_rate=30,
+                overall_time_period=1,
+                group_max_rate=20,
+                group_time_period=60,
+                max_retries=3,
+            )
+        )
+        .persistence(persistence)
+        .post_init(post_init)
+        .post_shutdown(post_shutdown)
+        .concurrent_updates(_ChatOrderedUpdateProcessor(MAX_CONCURRENT_UPDATES))
+        .build()
+    )
 
     # Setup handlers
     setup_handlers(application)
 
-    logger.info("🏠 Starting bot in development polling mode...")
     try:
-        application.run_polling(
-            drop_pending_updates=True,
-            allowed_updates=["message", "callback_query", "inline_query"],
-        )
+        if CFG.webhook_url:
+            # Telegram pushes updates to us, so there is no idle getUpdates traffic
+            logger.info("🌐 Starting bot in development webhook mode...")
+            application.run_webhook(
+                listen="0.0.0.0",  # noqa: S104 - must be reachable by Telegram
+                port=CFG.port,
+                url_path=CFG.bot_token,
+                webhook_url=f"{CFG.webhook_url.rstrip('/')}/{CFG.bot_token}",
+                secret_token=CFG.webhook_secret,
+                allowed_updates=ALLOWED_UPDATES,
+                drop_pending_updates=True,
+                bootstrap_retries=-1,
+            )
+        else:
+            logger.info("🏠 Starting bot in development polling mode...")
+            # Long-poll for the full 50s Telegram allows
+            application.run_polling(
+                drop_pending_updates=True,
+                allowed_updates=ALLOWED_UPDATES,
+                timeout=50,
+                poll_interval=CFG.poll_interval,
+                bootstrap_retries=-1,
+            )
     except KeyboardInterrupt:
         logger.info("👋 Bot stopped by user")
     except Exception as e:
-        logger.error(f"❌ Bot error: {e}")
+        logger.error("❌ Bot error: %s", e)
         raise
 
 
@@ -8,6 +8,21 @@ from typing import Any
 from ..constants import ACCOUNT_RESERVE, FAUCET_AMOUNT
 from .timezones import format_datetime_for_user
 
+# Fiat currencies shown with a symbol prefix (unknown codes fall back to "$")
+_FIAT_SYMBOLS = {
+    "USD": "$",
+    "EUR": "€",
+    "GBP": "£",
+    "ZAR": "R",
+    "JPY": "¥",
+}
+
+# Values format_hash renders as a plain "N/A"
+_MISSING_HASHES = frozenset({None, "", "N/A"})
+
+# Crypto currencies shown with a unit suffix: code -> decimal places
+_CRYPTO_DECIMALS = {"BTC": 8, "ETH": 6}
+
 
 def escape_html(text: str) -> str:
     """Safely escape HTML characters for Telegram HTML parsing.
@@ -24,6 +39,13 @@ def escape_html(text: str) -> str:
     return html.escape(str(text))
 
 
+def _to_decimal(amount: Decimal | float | str) -> Decimal:
+    """Return ``amount`` as a Decimal; floats go via str() to keep their short form."""
+    if isinstance(amount, Decimal):
+        return amount
+    return Decimal(str(amount))
+
+
 def format_xrp_address(address: str) -> str:
     """Format XRP address with safe HTML escaping and code styling.
 
@@ -52,13 +74,7 @@ def format_xrp_amount(amount: Decimal | float | str, decimals: int = 6) -> str:
         Formatted amount string
 
     """
-    if isinstance(amount, str):
-        amount = Decimal(amount)
-    elif isinstance(amount, float):
-        amount = Decimal(str(amount))
-
-    format_spec = f".{decimals}f"
-    return format(amount, format_spec)
+    return format(_to_decimal(amount), f".{decimals}f")
 
 
 def format_currency_amount(amount: Decimal | float | str, currency: str = "USD") -> str:
@@ -77,26 +93,14 @@ def format_currency_amount(amount: Decimal | float | str, currency: str = "USD")
         Formatted string with currency notation
 
     """
-    if isinstance(amount, str):
-        amount = Decimal(amount)
-    elif isinstance(amount, float):
-        amount = Decimal(str(amount))
+    amount = _to_decimal(amount)
 
     c = currency.upper()
-    if c in {"BTC", "ETH"}:
-        decimals = 8 if c == "BTC" else 6
-        fmt = f".{decimals}f"
-        return f"{format(amount, fmt)} {c}"
-
-    symbols = {
-        "USD": "$",
-        "EUR": "€",
-        "GBP": "£",
-        "ZAR": "R",
-        "JPY": "¥",
-    }
-    symbol = symbols.get(c, "$")
-    return f"{symbol}{amount:,.2f}"
+    decimals = _CRYPTO_DECIMALS.get(c)
+    if decimals is not None:
+        return f"{amount:.{decimals}f} {c}"
+
+    return f"{_FIAT_SYMBOLS.get(c, '$')}{amount:,.2f}"
 
 
 def format_hash(tx_hash: str, length: int = 10) -> str:
@@ -112,13 +116,14 @@ def format_hash(tx_hash: str, length: int = 10) -> str:
         Formatted hash string with HTML escaping
 
     """
-    if not tx_hash or tx_hash == "N/A":
-        return escape_html("N/A")
+    if tx_hash in _MISSING_HASHES:
+        return "N/A"
 
-    if len(tx_hash) <= length:
-        return f"<code>{escape_html(tx_hash)}</code>"
+    # Ledger hashes are 64 characters, so truncation is the common case
+    if len(tx_hash) > length:
+        return f"<code>{escape_html(tx_hash[:length])}...</code>"
 
-    return f"<code>{escape_html(tx_hash[:length])}...</code>"
+    return f"<code>{escape_html(tx_hash)}</code>"
 
 
 def format_username(username: str | None) -> str:
@@ -151,9 +156,7 @@ def format_error_message(error: str) -> str:
         Formatted error message
 
     """
-    # Safely escape and format the error message to prevent f-string conflicts
-    escaped_error = escape_html(str(error))
-    return "❌ <b>Error</b>\n\n<code>" + escaped_error + "</code>"
+    return f"❌ <b>Error</b>\n\n<code>{escape_html(str(error))}</code>"
 
 
 def format_error_message_with_title(title: str, error: str | list[str]) -> str:
@@ -169,15 +172,12 @@ def format_error_message_with_title(title: str, error: str | list[str]) -> str:
         Formatted error message
 
     """
-    # Safely escape title to prevent formatting conflicts
-    escaped_title = escape_html(str(title))
-
     if isinstance(error, list):
         error_text = "\n".join(str(line) for line in error)
     else:
         error_text = str(error)
 
-    return "❌ <b>" + escaped_title + "</b>\n\n" + error_text
+    return f"❌ <b>{escape_html(str(title))}</b>\n\n{error_text}"
 
 
 def format_success_message(title: str, message: str | list[str]) -> str:
@@ -193,15 +193,12 @@ def format_success_message(title: str, message: str | list[str]) -> str:
         Formatted success message
 
     """
-    # Safely escape title to prevent formatting conflicts
-    escaped_title = escape_html(str(title))
-
     if isinstance(message, list):
         message_text = "\n".join(str(line) for line in message)
     else:
         message_text = str(message)
 
-    return "✅ <b>" + escaped_title + "</b>\n\n" + message_text
+    return f"✅ <b>{escape_html(str(title))}</b>\n\n{message_text}"
 
 
 def format_warning_message(title: str, message: str) -> str:
@@ -217,9 +214,7 @@ def format_warning_message(title: str, message: str) -> str:
         Formatted warning message
 
     """
-    # Safely escape title to prevent formatting conflicts
-    escaped_title = escape_html(str(title))
-    return "⚠️ <b>" + escaped_title + "</b>\n\n" + message
+    return f"⚠️ <b>{escape_html(str(title))}</b>\n\n{message}"
 
 
 def format_balance_info(
@@ -248,19 +243,6 @@ def format_balance_info(
         Formatted balance message
 
     """
-    formatted_address = format_xrp_address(address)
-    formatted_balance = format_xrp_amount(balance)
-    formatted_available = format_xrp_amount(available)
-    formatted_fiat = format_currency_amount(fiat_value, fiat_currency)
-
-    message = (
-        "💰 <b>Your Balance</b>\n\n"
-        "📬 <b>Address:</b> " + formatted_address + "\n"
-        "💵 <b>Balance:</b> " + formatted_balance + " XRP\n"
-        "💸 <b>Available:</b> " + formatted_available + " XRP\n"
-        "📈 <b>Value:</b> " + formatted_fiat + "\n\n"
-    )
-
     timestamp = format_datetime_for_user(last_updated, timezone_code)
     if not timestamp:
         fallback_dt = datetime.now(timezone.utc)
@@ -268,9 +250,14 @@ def format_balance_info(
             "%Y-%m-%d %H:%M:%S UTC"
         )
 
-    message += "<i>Last updated: " + escape_html(timestamp) + "</i>"
-
-    return message
+    return (
+        "💰 <b>Your Balance</b>\n\n"
+        f"📬 <b>Address:</b> {format_xrp_address(address)}\n"
+        f"💵 <b>Balance:</b> {format_xrp_amount(balance)} XRP\n"
+        f"💸 <b>Available:</b> {format_xrp_amount(available)} XRP\n"
+        f"📈 <b>Value:</b> {format_currency_amount(fiat_value, fiat_currency)}\n\n"
+        f"<i>Last updated: {escape_html(timestamp)}</i>"
+    )
 
 
 def format_transaction_confirmation(
@@ -289,19 +276,16 @@ def format_transaction_confirmation(
         Formatted confirmation message
 
     """
-    total = Decimal(str(amount)) + Decimal(str(fee))
-
-    formatted_recipient = format_xrp_address(recipient)
-    formatted_amount = format_xrp_amount(amount)
-    formatted_fee = format_xrp_amount(fee)
-    formatted_total = format_xrp_amount(total)
+    # Convert once; format_xrp_amount passes Decimals straight through
+    amount = _to_decimal(amount)
+    fee = _to_decimal(fee)
 
     return (
         "📤 <b>Confirm Transaction</b>\n\n"
-        "<b>To:</b> " + formatted_recipient + "\n"
-        "<b>Amount:</b> " + formatted_amount + " XRP\n"
-        "<b>Fee:</b> " + formatted_fee + " XRP\n"
-        "<b>Total:</b> " + formatted_total + " XRP\n\n"
+        f"<b>To:</b> {format_xrp_address(recipient)}\n"
+        f"<b>Amount:</b> {format_xrp_amount(amount)} XRP\n"
+        f"<b>Fee:</b> {format_xrp_amount(fee)} XRP\n"
+        f"<b>Total:</b> {format_xrp_amount(amount + fee)} XRP\n\n"
         "⚠️ <i>Please review carefully.</i>\n\n"
         "Reply <b>YES</b> to confirm or <b>NO</b> to cancel."
     )
@@ -320,14 +304,57 @@ def format_transaction_success(tx_hash: str, explorer_url: str | None = None) ->
         Formatted success message
 
     """
-    message = "✅ <b>Transaction Successful!</b>\n\n<b>Hash:</b> " + format_hash(tx_hash) + "\n\n"
+    message = f"✅ <b>Transaction Successful!</b>\n\n<b>Hash:</b> {format_hash(tx_hash)}\n\n"
 
     if explorer_url:
-        message += '<a href="' + escape_html(explorer_url) + '">View on Explorer</a>'
+        message += f'<a href="{escape_html(explorer_url)}">View on Explorer</a>'
 
     return message
 
 
+# format_funding_instructions texts; they depend only on network constants
+_LOW_BALANCE_THRESHOLD = Decimal("5")
+
+_FUND_ACTIVATE_MAINNET = (
+    "\n\n⚠️ <b>Wallet Needs Activation</b>\n"
+    f"Your wallet needs at least {ACCOUNT_RESERVE} XRP to activate and transact.\n\n"
+    "<b>To fund your wallet:</b>\n"
+    "1. Copy your address above\n"
+    "2. Buy XRP from an exchange (Coinbase, Binance, etc.)\n"
+    "3. Send XRP to your address\n"
+    "4. Check balance again after confirmation\n\n"
+    "<i>💡 Minimum purchase usually covers activation costs.</i>"
+)
+
+_FUND_ACTIVATE_TESTNET = (
+    "\n\n⚠️ <b>Wallet Needs Activation</b>\n"
+    f"Your wallet needs at least {ACCOUNT_RESERVE} XRP to activate and transact.\n\n"
+    "<b>To fund your wallet:</b>\n"
+    "1. Copy your address above\n"
+    "2. Visit: <a href='https://xrpl.org/xrp-testnet-faucet.html'>\n"
+    "XRPL Testnet Faucet</a>\n"
+    f"3. Paste your address and request {FAUCET_AMOUNT} TestNet XRP\n"
+    "4. Check balance again in 5-10 seconds\n\n"
+    "<i>💡 On mainnet, you'd buy XRP from an exchange instead.</i>"
+)
+
+_FUND_LOW_MAINNET = (
+    "\n\n💡 <b>Low Balance Notice</b>\n"
+    "You have {available} XRP available for transactions.\n"
+    "Consider buying more XRP for larger transactions.\n\n"
+    "<i>💡 Buy XRP from exchanges like Coinbase or Binance.</i>"
+)
+
+_FUND_LOW_TESTNET = (
+    "\n\n💡 <b>Low Balance Notice</b>\n"
+    "You have {available} XRP available for transactions.\n"
+    "Consider adding more funds for larger transactions.\n\n"
+    "<b>Get more TestNet XRP:</b>\n"
+    "<a href='https://xrpl.org/xrp-testnet-faucet.html'>XRPL Testnet Faucet</a>\n\n"
+    "<i>💡 On mainnet, you'd buy XRP from an exchange.</i>"
+)
+
+
 def format_funding_instructions(balance: Decimal | float | str, is_mainnet: bool = False) -> str:
     """Format funding instructions based on current balance and network.
 
@@ -341,51 +368,13 @@ def format_funding_instructions(balance: Decimal | float | str, is_mainnet: bool
         Formatted funding instructions
 
     """
-    balance_decimal = Decimal(str(balance))
+    balance_decimal = _to_decimal(balance)
 
     if balance_decimal < ACCOUNT_RESERVE:  # Below minimum reserve
-        if is_mainnet:
-            return (
-                "\n\n⚠️ <b>Wallet Needs Activation</b>\n"
-                f"Your wallet needs at least {ACCOUNT_RESERVE} XRP to activate and transact.\n\n"
-                "<b>To fund your wallet:</b>\n"
-                "1. Copy your address above\n"
-                "2. Buy XRP from an exchange (Coinbase, Binance, etc.)\n"
-                "3. Send XRP to your address\n"
-                "4. Check balance again after confirmation\n\n"
-                "<i>💡 Minimum purchase usually covers activation costs.</i>"
-            )
-        else:
-            return (
-                "\n\n⚠️ <b>Wallet Needs Activation</b>\n"
-                f"Your wallet needs at least {ACCOUNT_RESERVE} XRP to activate and transact.\n\n"
-                "<b>To fund your wallet:</b>\n"
-                "1. Copy your address above\n"
-                "2. Visit: <a href='https://xrpl.org/xrp-testnet-faucet.html'>\n"
-                "XRPL Testnet Faucet</a>\n"
-                f"3. Paste your address and request {FAUCET_AMOUNT} TestNet XRP\n"
-                "4. Check balance again in 5-10 seconds\n\n"
-                "<i>💡 On mainnet, you'd buy XRP from an exchange instead.</i>"
-            )
-    elif balance_decimal < Decimal("5"):  # Low balance warning
-        if is_mainnet:
-            available_amount = format_xrp_amount(balance_decimal - ACCOUNT_RESERVE)
-            return (
-                "\n\n💡 <b>Low Balance Notice</b>\n"
-                "You have " + available_amount + " XRP available for transactions.\n"
-                "Consider buying more XRP for larger transactions.\n\n"
-                "<i>💡 Buy XRP from exchanges like Coinbase or Binance.</i>"
-            )
-        else:
-            available_amount = format_xrp_amount(balance_decimal - ACCOUNT_RESERVE)
-            return (
-                "\n\n💡 <b>Low Balance Notice</b>\n"
-                "You have " + available_amount + " XRP available for transactions.\n"
-                "Consider adding more funds for larger transactions.\n\n"
-                "<b>Get more TestNet XRP:</b>\n"
-                "<a href='https://xrpl.org/xrp-testnet-faucet.html'>XRPL Testnet Faucet</a>\n\n"
-                "<i>💡 On mainnet, you'd buy XRP from an exchange.</i>"
-            )
+        return _FUND_ACTIVATE_MAINNET if is_mainnet else _FUND_ACTIVATE_TESTNET
+    elif balance_decimal < _LOW_BALANCE_THRESHOLD:  # Low balance warning
+        template = _FUND_LOW_MAINNET if is_mainnet else _FUND_LOW_TESTNET
+        return template.format(available=format_xrp_amount(balance_decimal - ACCOUNT_RESERVE))
 
     return ""  # No funding message needed
 
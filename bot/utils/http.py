@@ -0,0 +1,41 @@
+"""Shared HTTP client for bot handler calls to the backend API."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import httpx
+
+_shared_client: httpx.AsyncClient | None = None
+
+
+def open_shared_client() -> httpx.AsyncClient:
+    """Create the process-wide client reused by api_client(), if not already open."""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient()
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the process-wide client; api_client() falls back to per-call clients."""
+    global _shared_client
+    client, _shared_client = _shared_client, None
+    if client is not None:
+        await client.aclose()
+
+
+@asynccontextmanager
+async def api_client() -> AsyncIterator[httpx.AsyncClient]:
+    """Yield the shared client, or a short-lived one when none is open.
+
+    The shared client keeps connections to the backend alive between calls; it
+    is left open on exit, so callers can use this exactly like
+    ``async with httpx.AsyncClient() as client``.
+    """
+    if _shared_client is not None and not _shared_client.is_closed:
+        yield _shared_client
+        return
+    async with httpx.AsyncClient() as client:
+        yield client
@@ -1,7 +1,9 @@
 """Comprehensive bot tests."""
 
 import asyncio
+import contextlib
 import os
+import time
 from datetime import datetime
 from decimal import Decimal
 from unittest.mock import AsyncMock, Mock, patch
@@ -13,23 +15,58 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import sessionmaker
 from telegram import Chat, InlineKeyboardMarkup, Update, User
 from telegram.constants import ParseMode
-from telegram.error import RetryAfter
-from telegram.ext import ContextTypes
+from telegram.error import (
+    BadRequest,
+    Forbidden,
+    NetworkError,
+    RetryAfter,
+    TelegramError,
+    TimedOut,
+)
+from telegram.ext import Application, ContextTypes, PicklePersistence
+from telegram.request import HTTPXRequest
 
 # Import test fixtures from backend tests
 from backend.database.models import Base, Beneficiary, Transaction, Wallet
 from backend.database.models import User as DBUser
 from backend.services.user_service import UserService
+from bot.handlers import price as price_handlers
 from bot.handlers.account import handle_username_update
 
 # Import bot modules for testing
 from bot.handlers.start import handle_import_wallet, start_command
+from bot.handlers.transaction import ADDRESS, AMOUNT, CONFIRM
+from bot.main import (
+    _ACTION_ROUTES,
+    _MAIN_MENU_TEXT,
+    _MENU_ROUTES,
+    _PARAM_HANDLERS,
+    USER_DATA_SWEEP_INTERVAL,
+    USER_DATA_TTL,
+    _build_persistence,
+    _ChatOrderedUpdateProcessor,
+    _classify_error,
+    _env_number,
+    _flush_persistence,
+    _in_chat_order,
+    _mark_user_seen,
+    _OrjsonHTTPXRequest,
+    _route_callback,
+    _sweep_stale_user_data,
+    callback_query_handler,
+    text_message_router,
+)
 from bot.utils.formatting import (
     escape_html,
+    format_currency_amount,
     format_error_message,
+    format_funding_instructions,
+    format_hash,
     format_price_heatmap,
+    format_transaction_confirmation,
     format_xrp_amount,
 )
+from bot.utils.http import api_client, close_shared_client, open_shared_client
 
 
 # Test fixtures and utilities
@@ -729,6 +766,444 @@ async def test_unit_message_handler_precedence_issue(telegram_update_factory, mo
         assert "awaiting_username_update" not in mock_context.user_data
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_unit_text_message_router_dispatches_by_state(telegram_update_factory, mock_context):
+    """Test that free text reaches the flow that is waiting for it."""
+    update = telegram_update_factory(123456789, "some text", 1)
+
+    with (
+        patch("bot.main.handle_username_update", new_callable=AsyncMock) as username_handler,
+        patch("bot.main.handle_wallet_import_message", new_callable=AsyncMock) as import_handler,
+    ):
+        # No pending input: nothing is dispatched
+        await text_message_router(update, mock_context)
+        username_handler.assert_not_called()
+        import_handler.assert_not_called()
+
+        # Wallet import state reaches the import handler
+        mock_context.user_data["import_state"] = "waiting_for_private_key"
+        await text_message_router(update, mock_context)
+        import_handler.assert_awaited_once_with(update, mock_context)
+        username_handler.assert_not_called()
+
+        # A pending username update takes precedence
+        mock_context.user_data["awaiting_username_update"] = True
+        await text_message_router(update, mock_context)
+        username_handler.assert_awaited_once_with(update, mock_context)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_unit_in_chat_order_serialises_per_chat_only():
+    """Test that update work runs in order within a chat but not across chats."""
+    events = []
+    release = asyncio.Event()
+
+    async def work(name, wait=False):
+        events.append(f"{name}:start")
+        if wait:
+            await release.wait()
+        events.append(f"{name}:end")
+
+    first = asyncio.create_task(_in_chat_order(1, work("a1", wait=True)))
+    second = asyncio.create_task(_in_chat_order(1, work("a2")))
+    other = asyncio.create_task(_in_chat_order(2, work("b1")))
+    await asyncio.sleep(0)
+    await other
+
+    # The other chat finished while chat 1's second press waited for the first
+    assert events == ["a1:start", "b1:start", "b1:end"]
+
+    release.set()
+    await asyncio.gather(first, second)
+    assert events[3:] == ["a1:end", "a2:start", "a2:end"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_unit_update_processor_orders_conversation_messages(telegram_update_factory):
+    """Test that two quick messages in the send flow each see the previous step's state."""
+    processor = _ChatOrderedUpdateProcessor(8)
+    state = {1: AMOUNT}
+    steps = []
+
+    async def converse(update):
+        # Like ConversationHandler: the step is chosen from the current state,
+        # which only advances once the (slow) step handler has finished
+        chat_id = update.effective_chat.id
+        current = state[chat_id]
+        steps.append((update.message.text, current))
+        await asyncio.sleep(0.01)
+        state[chat_id] = ADDRESS if current == AMOUNT else CONFIRM
+
+    amount = telegram_update_factory(1, "10", 1)
+    address = telegram_update_factory(1, "rPEPPER7kfTD9w2To4CQk6UCfuHM9c6GDY", 2)
+    await asyncio.gather(
+        processor.process_update(amount, converse(amount)),
+        processor.process_update(address, converse(address)),
+    )
+
+    assert steps == [("10", AMOUNT), ("rPEPPER7kfTD9w2To4CQk6UCfuHM9c6GDY", ADDRESS)]
+    assert state[1] == CONFIRM
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_unit_update_processor_backlog_does_not_block_other_chats(
+    telegram_update_factory,
+):
+    """Test that updates queued behind a busy chat don't take slots from other chats."""
+    processor = _ChatOrderedUpdateProcessor(1)
+    finished = []
+
+    async def handle(name, delay=0.0):
+        await asyncio.sleep(delay)
+        finished.append(name)
+
+    a1 = telegram_update_factory(1, "a1", 1)
+    a2 = telegram_update_factory(1, "a2", 2)
+    b1 = telegram_update_factory(2, "b1", 3)
+    await asyncio.gather(
+        processor.process_update(a1, handle("a1", 0.01)),
+        processor.process_update(a2, handle("a2", 0.01)),
+        processor.process_update(b1, handle("b1")),
+    )
+
+    # Chat 2 only waited for the slot chat 1 was using, not for chat 1's queue
+    assert finished == ["a1", "b1", "a2"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_unit_route_callback_dispatches_from_route_tables():
+    """Test exact, prefix, parameter, main menu and unknown callback routing."""
+    action, history_page, set_currency = AsyncMock(), AsyncMock(), AsyncMock()
+    update = Mock()
+    message = Mock()
+    message.edit_text = AsyncMock()
+    context = Mock()
+    context.user_data = {"nav_stack": ["settings"], "current_menu": "history"}
+
+    with (
+        patch.dict(_ACTION_ROUTES, {"refresh_balance": action}),
+        patch("bot.main._PREFIX_ROUTES", (("history_page_", "history", history_page),)),
+        patch.dict(_PARAM_HANDLERS, {"currency": set_currency}),
+    ):
+        # Exact action routes leave navigation alone
+        await _route_callback(update, context, "refresh_balance", message)
+        action.assert_awaited_once_with(update, context)
+
+        # Prefix routes render their menu in place
+        await _route_callback(update, context, "history_page_2", message)
+        history_page.assert_awaited_once_with(update, context)
+        assert list(context.user_data["nav_stack"]) == ["settings"]
+        assert context.user_data["current_menu"] == "history"
+
+        # Parameter routes pass the suffix to the handler
+        await _route_callback(update, context, "set_currency_EUR", message)
+        set_currency.assert_awaited_once_with(update, context, "EUR")
+
+        # Unknown data is ignored
+        await _route_callback(update, context, "no_such_button", message)
+        message.edit_text.assert_not_called()
+
+        # main_menu forgets the navigation history
+        await _route_callback(update, context, "main_menu", message)
+        assert message.edit_text.await_args.args[0] == _MAIN_MENU_TEXT
+        assert not context.user_data["nav_stack"]
+        assert context.user_data["current_menu"] == "main_menu"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_unit_callback_answer_failure_does_not_cancel_routing():
+    """Test that a failed callback answer is swallowed while the route still completes."""
+    routed = asyncio.Event()
+
+    async def toggle(*_args):
+        await asyncio.sleep(0.01)
+        routed.set()
+
+    update = Mock()
+    update.callback_query.data = "toggle_notifications"
+    update.callback_query.answer = AsyncMock(side_effect=BadRequest("Query is too old"))
+    context = Mock()
+    context.user_data = {}
+
+    with patch.dict(_PARAM_HANDLERS, {"toggle": toggle}):
+        await callback_query_handler(update, context)
+
+    assert routed.is_set()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_unit_route_callback_pushes_and_pops_nav_stack():
+    """Test that forward navigation pushes the current menu and back pops it."""
+    settings, currency = AsyncMock(), AsyncMock()
+    update = Mock()
+    message = Mock()
+    message.edit_text = AsyncMock()
+    context = Mock()
+    context.user_data = {}
+
+    with patch.dict(
+        _MENU_ROUTES,
+        {
+            "settings": ("settings", settings),
+            "currency_settings": ("currency_settings", currency),
+        },
+    ):
+        # The main menu itself is never pushed
+        await _route_callback(update, context, "settings", message)
+        assert not context.user_data["nav_stack"]
+
+        await _route_callback(update, context, "currency_settings", message)
+        assert list(context.user_data["nav_stack"]) == ["settings"]
+        assert context.user_data["current_menu"] == "currency_settings"
+
+        await _route_callback(update, context, "back", message)
+        assert settings.await_count == 2
+        assert not context.user_data["nav_stack"]
+        assert context.user_data["current_menu"] == "settings"
+
+        # Back with nothing left returns to the main menu
+        await _route_callback(update, context, "back", message)
+        assert message.edit_text.await_args.args[0] == _MAIN_MENU_TEXT
+        assert context.user_data["current_menu"] == "main_menu"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_unit_route_callback_debounces_only_repeatable_views():
+    """Test that double taps on a menu are dropped but back and toggles always count."""
+    settings, security, toggle = AsyncMock(), AsyncMock(), AsyncMock()
+    update = Mock()
+    context = Mock()
+    context.user_data = {
+        "nav_stack": ["settings", "security_settings"],
+        "current_menu": "notification_settings",
+    }
+
+    with (
+        patch.dict(
+            _MENU_ROUTES,
+            {
+                "settings": ("settings", settings),
+                "security_settings": ("security_settings", security),
+            },
+        ),
+        patch.dict(_PARAM_HANDLERS, {"toggle": toggle}),
+    ):
+        # Two quick "back" presses go up two levels
+        await _route_callback(update, context, "back", None)
+        await _route_callback(update, context, "back", None)
+        security.assert_awaited_once_with(update, context)
+        settings.assert_awaited_once_with(update, context)
+        assert context.user_data["current_menu"] == "settings"
+
+        # Two quick toggles flip the setting twice
+        await _route_callback(update, context, "toggle_notifications", None)
+        await _route_callback(update, context, "toggle_notifications", None)
+        assert toggle.await_count == 2
+
+        # A double tap on a menu only renders it once
+        await _route_callback(update, context, "security_settings", None)
+        await _route_callback(update, context, "security_settings", None)
+        assert security.await_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_unit_mark_user_seen_refreshes_once_per_sweep_interval():
+    """Test that activity timestamps only change when they are stale enough to matter."""
+    now = time.time()
+    context = Mock()
+    context.user_data = {"_last_seen": now - 60}
+
+    await _mark_user_seen(Mock(), context)
+    assert context.user_data["_last_seen"] == now - 60
+
+    context.user_data["_last_seen"] = now - USER_DATA_SWEEP_INTERVAL - 1
+    await _mark_user_seen(Mock(), context)
+    assert context.user_data["_last_seen"] >= now
+
+    context.user_data = {}
+    await _mark_user_seen(Mock(), context)
+    assert context.user_data["_last_seen"] >= now
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_unit_persistence_writes_state_once_per_flush(tmp_path):
+    """Test that a persistence cycle with several changed users writes the file once."""
+    application = (
+        Application.builder()
+        .token("123:ABC")
+        .persistence(_build_persistence(str(tmp_path / "state.pkl")))
+        .build()
+    )
+    for user_id in (1, 2, 3):
+        application.user_data[user_id]["current_menu"] = "settings"
+    application.mark_data_for_update_persistence(user_ids=[1, 2, 3])
+    context = Mock()
+    context.application = application
+
+    with patch.object(PicklePersistence, "_dump_singlefile", autospec=True) as dump:
+        await application.update_persistence()
+        dump.assert_not_called()
+
+        await _flush_persistence(context)
+        dump.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_unit_sweep_drops_only_inactive_user_data():
+    """Test that the periodic sweep forgets users inactive for longer than the TTL."""
+    now = time.time()
+    context = Mock()
+    context.application.user_data = {
+        1: {"_last_seen": now - USER_DATA_TTL - 1, "nav_stack": ["settings"]},
+        2: {"_last_seen": now},
+        3: {},
+    }
+
+    await _sweep_stale_user_data(context)
+
+    dropped = {call.args[0] for call in context.application.drop_user_data.call_args_list}
+    assert dropped == {1, 3}
+
+
+@pytest.mark.unit
+def test_unit_env_number_falls_back_on_malformed_values(monkeypatch):
+    """Test that a bad numeric setting can't stop bot.main from importing."""
+    monkeypatch.setenv("TELEGRAM_POOL_SIZE", "8")
+    assert _env_number("TELEGRAM_POOL_SIZE", 32) == 8
+    monkeypatch.setenv("TELEGRAM_POOL_SIZE", "eight")
+    assert _env_number("TELEGRAM_POOL_SIZE", 32) == 32
+    monkeypatch.setenv("POLL_INTERVAL", "")
+    assert _env_number("POLL_INTERVAL", 0.0) == 0.0
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b'{"ok": true, "result": {"text": "caf\xe9"}}',
+        b'{"ok": true, "result": []}',
+    ],
+    ids=["invalid-utf8", "valid"],
+)
+def test_unit_orjson_request_matches_stock_parser(payload):
+    """Test that payloads orjson rejects are parsed exactly like the stock parser does."""
+    assert _OrjsonHTTPXRequest.parse_json_payload(payload) == HTTPXRequest.parse_json_payload(
+        payload
+    )
+
+
+@pytest.mark.unit
+def test_unit_orjson_request_rejects_invalid_json():
+    """Test that invalid JSON still raises the stock parser's TelegramError."""
+    with pytest.raises(TelegramError, match="Invalid server response"):
+        _OrjsonHTTPXRequest.parse_json_payload(b"<html>Bad Gateway</html>")
+
+
+@pytest.mark.unit
+def test_unit_classify_error_prefers_exception_type():
+    """Test that error_handler picks its message from the exception type first."""
+    assert _classify_error(TimedOut()) == "timeout"
+    assert _classify_error(asyncio.TimeoutError()) == "timeout"
+    assert _classify_error(Forbidden("bot was blocked by the user")) == "auth"
+    assert _classify_error(BadRequest("Message is not modified")) == "bad_request"
+    # Plain NetworkErrors fall back to their message, then to the network category
+    assert _classify_error(NetworkError("httpx.ConnectError: refused")) == "connection"
+    assert _classify_error(NetworkError("httpx.ReadError: ")) == "network"
+    assert _classify_error(ValueError("request timeout")) == "timeout"
+    assert _classify_error(ValueError("boom")) == "generic"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_unit_api_client_reuses_shared_client():
+    """Test that handlers share one open client and fall back to per-call clients."""
+    shared = open_shared_client()
+    try:
+        async with api_client() as first:
+            pass
+        async with api_client() as second:
+            pass
+        assert first is second is shared
+        assert not shared.is_closed
+    finally:
+        await close_shared_client()
+
+    assert shared.is_closed
+    async with api_client() as fallback:
+        assert fallback is not shared
+    assert fallback.is_closed
+
+
+def _fake_price_api(*statuses, delay=0.0):
+    """Patch the price handler's API client to answer with ``statuses`` in turn."""
+    responses = iter(statuses)
+
+    async def get(*_args, **_kwargs):
+        await asyncio.sleep(delay)
+        response = Mock()
+        response.status_code = next(responses)
+        response.json.return_value = {"price_usd": 0.5}
+        return response
+
+    client = Mock()
+    client.get = AsyncMock(side_effect=get)
+
+    @contextlib.asynccontextmanager
+    async def api_client():
+        yield client
+
+    return client, patch.object(price_handlers, "api_client", api_client)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_unit_price_cache_reuses_then_refetches_after_ttl():
+    """Test that price data is reused within PRICE_CACHE_TTL and refetched after it."""
+    api_url = "http://price-cache-ttl.test"
+    client, api = _fake_price_api(200, 200)
+
+    with api:
+        first = await price_handlers.fetch_price_data(api_url, "key")
+        assert await price_handlers.fetch_price_data(api_url, "key") is first
+        assert client.get.await_count == 1
+
+        fetched_at, data = price_handlers._price_cache[api_url]
+        price_handlers._price_cache[api_url] = (
+            fetched_at - price_handlers.PRICE_CACHE_TTL,
+            data,
+        )
+        await price_handlers.fetch_price_data(api_url, "key")
+        assert client.get.await_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_unit_price_cache_skips_failures_and_coalesces_misses():
+    """Test that failed fetches aren't cached and concurrent misses share one request."""
+    api_url = "http://price-cache-miss.test"
+    client, api = _fake_price_api(503, 200, delay=0.01)
+
+    with api:
+        assert await price_handlers.fetch_price_data(api_url, "key") is None
+        results = await asyncio.gather(
+            *(price_handlers.fetch_price_data(api_url, "key") for _ in range(5))
+        )
+
+    assert results == [{"price_usd": 0.5}] * 5
+    assert client.get.await_count == 2
+
+
 def test_format_price_heatmap_renders_segments():
     """Heatmap formatter should include emojis, legend, and price stats."""
     heatmap_data = {
@@ -774,3 +1249,127 @@ def test_format_price_heatmap_handles_empty_segments():
     message = format_price_heatmap({"label": "1 Year", "segments": []}, "USD")
     assert "Data unavailable" in message
     assert "Segments: 0" in message
+
+
+@pytest.mark.parametrize(
+    ("tx_hash", "expected"),
+    [
+        (None, "N/A"),
+        ("", "N/A"),
+        ("N/A", "N/A"),
+        ("ABC123", "<code>ABC123</code>"),
+        ("0123456789", "<code>0123456789</code>"),
+        (
+            "E3FE6EA3D48F0C2B639448020EA4F03D4F4F8FFDB243A852A0F59177921B4879",
+            "<code>E3FE6EA3D4...</code>",
+        ),
+        ("<b>&amp;</b>", "<code>&lt;b&gt;&amp;amp;&lt;/...</code>"),
+    ],
+    ids=["none", "empty", "na", "short", "exact-length", "ledger-hash", "escaped"],
+)
+def test_format_hash_output(tx_hash, expected):
+    """format_hash output is pinned for missing, short and truncated hashes."""
+    assert format_hash(tx_hash) == expected
+
+
+_FUNDING_ACTIVATE_MAINNET = (
+    "\n\n⚠️ <b>Wallet Needs Activation</b>\n"
+    "Your wallet needs at least 1 XRP to activate and transact.\n\n"
+    "<b>To fund your wallet:</b>\n"
+    "1. Copy your address above\n"
+    "2. Buy XRP from an exchange (Coinbase, Binance, etc.)\n"
+    "3. Send XRP to your address\n"
+    "4. Check balance again after confirmation\n\n"
+    "<i>💡 Minimum purchase usually covers activation costs.</i>"
+)
+_FUNDING_ACTIVATE_TESTNET = (
+    "\n\n⚠️ <b>Wallet Needs Activation</b>\n"
+    "Your wallet needs at least 1 XRP to activate and transact.\n\n"
+    "<b>To fund your wallet:</b>\n"
+    "1. Copy your address above\n"
+    "2. Visit: <a href='https://xrpl.org/xrp-testnet-faucet.html'>\n"
+    "XRPL Testnet Faucet</a>\n"
+    "3. Paste your address and request 10 TestNet XRP\n"
+    "4. Check balance again in 5-10 seconds\n\n"
+    "<i>💡 On mainnet, you'd buy XRP from an exchange instead.</i>"
+)
+_FUNDING_LOW_MAINNET = (
+    "\n\n💡 <b>Low Balance Notice</b>\n"
+    "You have 2.500000 XRP available for transactions.\n"
+    "Consider buying more XRP for larger transactions.\n\n"
+    "<i>💡 Buy XRP from exchanges like Coinbase or Binance.</i>"
+)
+_FUNDING_LOW_TESTNET = (
+    "\n\n💡 <b>Low Balance Notice</b>\n"
+    "You have 2.000000 XRP available for transactions.\n"
+    "Consider adding more funds for larger transactions.\n\n"
+    "<b>Get more TestNet XRP:</b>\n"
+    "<a href='https://xrpl.org/xrp-testnet-faucet.html'>XRPL Testnet Faucet</a>\n\n"
+    "<i>💡 On mainnet, you'd buy XRP from an exchange.</i>"
+)
+
+
+@pytest.mark.parametrize(
+    ("balance", "is_mainnet", "expected"),
+    [
+        (Decimal("0"), True, _FUNDING_ACTIVATE_MAINNET),
+        ("0.5", False, _FUNDING_ACTIVATE_TESTNET),
+        (3.5, True, _FUNDING_LOW_MAINNET),
+        (Decimal("3"), False, _FUNDING_LOW_TESTNET),
+        ("5", False, ""),
+        (Decimal("25"), True, ""),
+    ],
+    ids=[
+        "activate-mainnet",
+        "activate-testnet",
+        "low-mainnet",
+        "low-testnet",
+        "threshold",
+        "healthy",
+    ],
+)
+def test_format_funding_instructions_output(balance, is_mainnet, expected):
+    """format_funding_instructions output is pinned for each network and balance band."""
+    assert format_funding_instructions(balance, is_mainnet=is_mainnet) == expected
+
+
+@pytest.mark.parametrize(
+    ("amount", "fee"),
+    [
+        ("12.5", 0.000012),
+        (Decimal("12.5"), Decimal("0.000012")),
+        (12.5, "0.000012"),
+    ],
+    ids=["str-float", "decimal", "float-str"],
+)
+def test_format_transaction_confirmation_output(amount, fee):
+    """format_transaction_confirmation output is pinned for each input type."""
+    assert format_transaction_confirmation("rPEPPER7kfTD9w2To4CQk6UCfuHM9c6GDY", amount, fee) == (
+        "📤 <b>Confirm Transaction</b>\n\n"
+        "<b>To:</b> <code>rPEPPER7kfTD9w2To4CQk6UCfuHM9c6GDY</code>\n"
+        "<b>Amount:</b> 12.500000 XRP\n"
+        "<b>Fee:</b> 0.000012 XRP\n"
+        "<b>Total:</b> 12.500012 XRP\n\n"
+        "⚠️ <i>Please review carefully.</i>\n\n"
+        "Reply <b>YES</b> to confirm or <b>NO</b> to cancel."
+    )
+
+
+@pytest.mark.parametrize(
+    ("amount", "currency", "expected"),
+    [
+        (1234.5, "USD", "$1,234.50"),
+        ("1234.5", "EUR", "€1,234.50"),
+        (Decimal("1234.5"), "GBP", "£1,234.50"),
+        (1234.5, "ZAR", "R1,234.50"),
+        (1234.5, "JPY", "¥1,234.50"),
+        (1234.5, "chf", "$1,234.50"),
+        (0.5, "eur", "€0.50"),
+        (Decimal("0.123456789"), "BTC", "0.12345679 BTC"),
+        ("0.1234567", "eth", "0.123457 ETH"),
+    ],
+    ids=["usd", "eur", "gbp", "zar", "jpy", "unknown", "lowercase", "btc", "eth"],
+)
+def test_format_currency_amount_output(amount, currency, expected):
+    """format_currency_amount output is pinned for every fiat and crypto branch."""
+    assert format_currency_amount(amount, currency) == expected